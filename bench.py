@@ -0,0 +1,175 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+import streamlit as st
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.testing.v1 import AppTest
+
+import sections
+
+# Headless render benchmark. Every sidebar section, and every map view and
+# environmental topic, is rendered through Streamlit's AppTest. For each one
+# we record the wall time of the run, the peak Python memory allocated during
+# it, and the number and protobuf size of the delta messages it sends to the
+# browser. Results go to a JSON file; comparing it against a stored baseline
+# flags the metrics that got worse.
+SCRIPT = Path(__file__).parent / 'malaysia_dashboard.py'
+RESULTS_FILE = 'bench_results.json'
+BASELINE_FILE = 'bench_baseline.json'
+
+# A metric regresses when it is more than TOLERANCE above the baseline, and
+# for wall time also more than MIN_WALL_MS, so timer noise on fast sections
+# is not flagged
+TOLERANCE = 0.2
+MIN_WALL_MS = 5.0
+METRICS = ['wall_ms', 'peak_memory_bytes', 'deltas', 'payload_bytes']
+
+
+class MessageCounter:
+    """Counts the delta messages the script enqueues for the browser."""
+
+    def __init__(self):
+        self.deltas = 0
+        self.payload_bytes = 0
+        self._enqueue = ForwardMsgQueue.enqueue
+
+    def __enter__(self):
+        counter = self
+
+        def enqueue(queue, msg):
+            if msg.WhichOneof('type') == 'delta':
+                counter.deltas += 1
+                counter.payload_bytes += msg.ByteSize()
+            return counter._enqueue(queue, msg)
+
+        self._patch = mock.patch.object(ForwardMsgQueue, 'enqueue', enqueue)
+        self._patch.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._patch.stop()
+
+
+def _select(widgets, label, option):
+    widget = next((widget for widget in widgets if widget.label == label), None)
+    if widget is None:
+        raise RuntimeError(f"No selectbox labelled {label!r} on the page")
+    widget.select(option)
+
+
+def _prepare(section, label, option, timeout):
+    # A session with the section open, one interaction away from the view
+    at = AppTest.from_file(str(SCRIPT), default_timeout=timeout).run()
+    _select(at.sidebar.selectbox, "Choose Section:", section)
+    if label is not None:
+        at.run()
+        _select(at.main.selectbox, label, option)
+    return at
+
+
+def _check(at, name):
+    if at.exception:
+        raise RuntimeError(f"{name} raised: {at.exception[0].message}")
+
+
+def measure(name, section, label, option, repeat=5, timeout=120):
+    walls, counts = [], None
+    # The first run fills the data and figure caches and is not counted
+    for i in range(repeat + 1):
+        at = _prepare(section, label, option, timeout)
+        with MessageCounter() as counter:
+            start = time.perf_counter()
+            at.run()
+            wall = time.perf_counter() - start
+        _check(at, name)
+        if i:
+            walls.append(wall * 1000)
+            counts = counter
+
+    # Memory is traced in a separate run, since tracing slows it down
+    at = _prepare(section, label, option, timeout)
+    tracemalloc.start()
+    try:
+        at.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    _check(at, name)
+
+    return {
+        'wall_ms': round(statistics.median(walls), 2),
+        'wall_ms_min': round(min(walls), 2),
+        'peak_memory_bytes': peak,
+        'deltas': counts.deltas,
+        'payload_bytes': counts.payload_bytes,
+    }
+
+
+def run(repeat=5, timeout=120, only=None):
+    results = {}
+    for name, section, label, option in sections.views():
+        if only and not any(text.lower() in name.lower() for text in only):
+            continue
+        results[name] = measure(name, section, label, option, repeat, timeout)
+        print(f"{name}: {results[name]['wall_ms']:.1f} ms, {results[name]['deltas']} deltas, "
+              f"{results[name]['payload_bytes']:,} B, peak {results[name]['peak_memory_bytes'] / 1e3:,.0f} kB")
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'streamlit': st.__version__,
+        'repeat': repeat,
+        'scenarios': results,
+    }
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Metrics more than tolerance worse than the baseline, as text lines."""
+    regressions = []
+    for name, metrics in results['scenarios'].items():
+        before = baseline['scenarios'].get(name)
+        if before is None:
+            continue
+        for metric in METRICS:
+            old, new = before.get(metric), metrics[metric]
+            if not old or new <= old * (1 + tolerance):
+                continue
+            if metric == 'wall_ms' and new - old <= MIN_WALL_MS:
+                continue
+            regressions.append(f"{name}: {metric} {old:,} -> {new:,} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the render of every dashboard section headlessly.')
+    parser.add_argument('--output', default=RESULTS_FILE, type=Path)
+    parser.add_argument('--baseline', default=BASELINE_FILE, type=Path,
+                        help='compare against this results file when it exists')
+    parser.add_argument('--save-baseline', action='store_true', help='also store the results as the new baseline')
+    parser.add_argument('--repeat', default=5, type=int, help='measured runs per view')
+    parser.add_argument('--tolerance', default=TOLERANCE, type=float)
+    parser.add_argument('--timeout', default=120, type=float, help='seconds allowed per script run')
+    parser.add_argument('--only', nargs='*', help='benchmark only views whose name contains one of these')
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.timeout, args.only)
+    args.output.write_text(json.dumps(results, indent=2) + '\n')
+    print(f'wrote {args.output}')
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + '\n')
+        print(f'wrote {args.baseline}')
+    elif args.baseline.exists():
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for line in regressions:
+            print(f'REGRESSION {line}')
+        if regressions:
+            sys.exit(1)
+        print(f'no regressions against {args.baseline}')
@@ -0,0 +1,163 @@
+import argparse
+import gzip
+import json
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Administrative boundaries for the choropleth views. Full-resolution state
+# outlines (Sabah and Sarawak alone are several MB) are simplified ahead of
+# time at each tolerance in TOLERANCES and stored as rounded, minified,
+# gzipped GeoJSON, one file per level:
+#
+#   data/boundaries/<kind>/<tolerance>.geojson.gz
+#
+# The map then loads the coarsest level that still looks exact at its zoom.
+BOUNDARY_DIR = Path(os.environ.get('DASHBOARD_BOUNDARY_DIR', Path(__file__).parent / 'data' / 'boundaries'))
+
+# Degrees; 0.0005 is roughly 55 m on the ground
+TOLERANCES = [0.0005, 0.002, 0.008, 0.03]
+
+
+def _perpendicular_distance(points, start, end):
+    line = end - start
+    length = np.hypot(line[0], line[1])
+    if length == 0:
+        return np.hypot(points[:, 0] - start[0], points[:, 1] - start[1])
+    return np.abs(line[0] * (start[1] - points[:, 1]) - line[1] * (start[0] - points[:, 0])) / length
+
+
+def simplify_line(coords, tolerance):
+    """Douglas-Peucker simplification of an (n, 2) coordinate array."""
+    coords = np.asarray(coords, dtype='float64')
+    if len(coords) < 3:
+        return coords
+
+    keep = np.zeros(len(coords), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(coords) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        distances = _perpendicular_distance(coords[first + 1:last], coords[first], coords[last])
+        split = int(np.argmax(distances))
+        if distances[split] > tolerance:
+            split += first + 1
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return coords[keep]
+
+
+def simplify_ring(ring, tolerance):
+    ring = np.asarray(ring, dtype='float64')
+    # Islands and enclaves smaller than the tolerance would collapse to a
+    # sliver, so they are dropped instead
+    extent = ring.max(axis=0) - ring.min(axis=0)
+    if extent.max() < tolerance:
+        return None
+
+    # Split the closed ring at its farthest point from the start, so neither
+    # half has identical endpoints
+    far = int(np.argmax(np.hypot(*(ring - ring[0]).T)))
+    if far == 0:
+        return None
+    first = simplify_line(ring[:far + 1], tolerance)
+    second = simplify_line(ring[far:], tolerance)
+    simplified = np.vstack([first, second[1:]])
+    if len(simplified) < 4:
+        return None
+    return simplified
+
+
+def simplify_geometry(geometry, tolerance, decimals):
+    if geometry['type'] == 'Polygon':
+        polygons = [geometry['coordinates']]
+    elif geometry['type'] == 'MultiPolygon':
+        polygons = geometry['coordinates']
+    else:
+        raise ValueError(f"Unsupported boundary geometry type '{geometry['type']}'")
+
+    simplified = []
+    for polygon in polygons:
+        exterior = simplify_ring(polygon[0], tolerance)
+        if exterior is None:
+            continue
+        holes = [simplify_ring(hole, tolerance) for hole in polygon[1:]]
+        rings = [exterior] + [hole for hole in holes if hole is not None]
+        simplified.append([np.round(ring, decimals).tolist() for ring in rings])
+
+    if not simplified:
+        # Keep at least the largest polygon so no region vanishes from the map
+        largest = max(polygons, key=lambda polygon: len(polygon[0]))
+        simplified = [[np.round(np.asarray(largest[0], dtype='float64'), decimals).tolist()]]
+
+    if len(simplified) == 1:
+        return {'type': 'Polygon', 'coordinates': simplified[0]}
+    return {'type': 'MultiPolygon', 'coordinates': simplified}
+
+
+def level_path(kind, tolerance, boundary_dir=None):
+    return Path(boundary_dir or BOUNDARY_DIR) / kind / f'{tolerance}.geojson.gz'
+
+
+def build_levels(source, kind, name_field, boundary_dir=None):
+    """Simplify a full-resolution GeoJSON at every tolerance and store the levels."""
+    with open(source, encoding='utf-8') as f:
+        collection = json.load(f)
+
+    paths = []
+    for tolerance in TOLERANCES:
+        # Coordinates only need to be a little finer than the tolerance
+        decimals = max(3, math.ceil(-math.log10(tolerance)) + 1)
+        features = [
+            {
+                'type': 'Feature',
+                'properties': {'name': feature['properties'][name_field]},
+                'geometry': simplify_geometry(feature['geometry'], tolerance, decimals),
+            }
+            for feature in collection['features']
+        ]
+        path = level_path(kind, tolerance, boundary_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump({'type': 'FeatureCollection', 'features': features}, f, separators=(',', ':'))
+        paths.append(path)
+    return paths
+
+
+def available(kind, boundary_dir=None):
+    return all(level_path(kind, tolerance, boundary_dir).exists() for tolerance in TOLERANCES)
+
+
+def tolerance_for_zoom(zoom):
+    # Use the coarsest level whose error stays under about one screen pixel
+    degrees_per_pixel = 360 / (256 * 2 ** zoom)
+    fitting = [tolerance for tolerance in TOLERANCES if tolerance <= degrees_per_pixel]
+    return max(fitting) if fitting else min(TOLERANCES)
+
+
+def fingerprint(kind, boundary_dir=None):
+    stats = [level_path(kind, tolerance, boundary_dir).stat() for tolerance in TOLERANCES]
+    return tuple((stat.st_size, stat.st_mtime_ns) for stat in stats)
+
+
+def load(kind, tolerance, boundary_dir=None):
+    with gzip.open(level_path(kind, tolerance, boundary_dir), 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Precompute simplified boundary levels for the choropleth views.')
+    parser.add_argument('source', type=Path, help='full-resolution GeoJSON FeatureCollection')
+    parser.add_argument('--kind', default='states', help="boundary set to write, e.g. 'states' or 'districts'")
+    parser.add_argument('--name-field', default='name', help='feature property holding the region name')
+    parser.add_argument('--boundary-dir', default=BOUNDARY_DIR, type=Path)
+    args = parser.parse_args()
+
+    print(f'source: {args.source.stat().st_size:,} bytes')
+    for path in build_levels(args.source, args.kind, args.name_field, args.boundary_dir):
+        print(f'wrote {path} ({path.stat().st_size:,} bytes)')
@@ -0,0 +1,471 @@
+import os
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+import downsample
+from trade_cube import BUNDLED_YEAR
+
+# Figure builders for every chart in the dashboard. Each one is a pure
+# function of its input tables so the result can be cached by figure_cache.
+
+# House style shared by every figure. It is set on each figure's layout rather
+# than only in the template, because Streamlit's chart theme overwrites the
+# template's fonts and background colours in the browser.
+HOUSE_STYLE = dict(
+    font_family="Times New Roman",
+    title_font_family="Times New Roman",
+    paper_bgcolor='white',
+    plot_bgcolor='white'
+)
+
+# Slim template used instead of the stock one, which every figure would
+# otherwise carry in full in its JSON: trace defaults for a few dozen chart
+# types and geo/polar/ternary/scene settings we never draw. Only the colorway
+# is kept, taken from Streamlit's template when available so its theme can
+# still recolour traces without explicit colours.
+_base = pio.templates['streamlit'] if 'streamlit' in pio.templates else pio.templates['plotly']
+pio.templates['dashboard'] = go.layout.Template(layout=go.Layout(colorway=_base.layout.colorway, **HOUSE_STYLE))
+pio.templates.default = 'dashboard'
+
+# Traces with more points than this are drawn with WebGL instead of SVG
+WEBGL_THRESHOLD = int(os.environ.get('DASHBOARD_WEBGL_THRESHOLD', 2000))
+
+
+def scatter(**kwargs):
+    """go.Scatter, or go.Scattergl for traces above WEBGL_THRESHOLD points.
+
+    Both take the same line, marker, fill and axis settings, so a chart looks
+    the same either way.
+    """
+    points = len(kwargs['x']) if kwargs.get('x') is not None else len(kwargs.get('y', ()))
+    if points > WEBGL_THRESHOLD:
+        return go.Scattergl(**kwargs)
+    return go.Scatter(**kwargs)
+
+
+def render_mode(points):
+    # The same switch for Plotly Express line and scatter charts
+    return 'webgl' if points > WEBGL_THRESHOLD else 'svg'
+
+
+def fig_pie(crop_data):
+    fig_pie = px.pie(
+        crop_data,
+        values='Area_Million_Ha',
+        names='Crop',
+        title="Land Distribution by Crop (Million Hectares)",
+        color_discrete_sequence=['#2E4057', '#548CA8', '#334257', '#476072', '#8B9DC3', '#A8DADC', '#B8B8B8']
+    )
+    fig_pie.update_layout(**HOUSE_STYLE)
+    return fig_pie
+
+
+def fig_trade(crop_data):
+    # Net trade balance
+    fig_trade = px.bar(
+        crop_data,
+        x='Crop',
+        y='Net_Trade_Billion_USD',
+        title="Net Trade Balance by Crop (Billion USD)",
+        color='Net_Trade_Billion_USD',
+        color_continuous_scale=['#dc3545', '#ffffff', '#28a745']
+    )
+    fig_trade.update_layout(
+        **HOUSE_STYLE,
+        showlegend=False
+    )
+    fig_trade.add_hline(y=0, line_dash="dash", line_color="black")
+    return fig_trade
+
+
+def fig_schemes(felda_data, max_points=downsample.MAX_POINTS):
+    fig_schemes = go.Figure()
+    fig_schemes.add_trace(scatter(
+        **downsample.xy(felda_data['Year'], felda_data['Schemes_Opened'], max_points),
+        mode='lines+markers',
+        name='FELDA Schemes',
+        line=dict(color='#2E4057', width=4),
+        marker=dict(size=8)
+    ))
+    fig_schemes.update_layout(
+        title="FELDA Schemes Development",
+        xaxis_title="Year",
+        yaxis_title="Number of Schemes",
+        **HOUSE_STYLE
+    )
+    return fig_schemes
+
+
+def fig_settlers(felda_data, max_points=downsample.MAX_POINTS):
+    fig_settlers = go.Figure()
+    fig_settlers.add_trace(scatter(
+        **downsample.xy(felda_data['Year'], felda_data['Settlers_Families'], max_points),
+        mode='lines+markers',
+        name='Settler Families',
+        line=dict(color='#548CA8', width=4),
+        marker=dict(size=8),
+        fill='tonexty'
+    ))
+    fig_settlers.update_layout(
+        title="FELDA Settler Families Growth",
+        xaxis_title="Year",
+        yaxis_title="Number of Families",
+        **HOUSE_STYLE
+    )
+    return fig_settlers
+
+
+def fig_trade_compare(crop_data, year=BUNDLED_YEAR):
+    # Export vs Import comparison
+    fig_trade_compare = go.Figure()
+
+    fig_trade_compare.add_trace(go.Bar(
+        name='Exports',
+        x=crop_data['Crop'],
+        y=crop_data['Export_Value_Billion_USD'],
+        marker_color='#28a745',
+        yaxis='y'
+    ))
+
+    fig_trade_compare.add_trace(go.Bar(
+        name='Imports',
+        x=crop_data['Crop'],
+        y=crop_data['Import_Value_Billion_USD'],
+        marker_color='#dc3545',
+        yaxis='y'
+    ))
+
+    fig_trade_compare.update_layout(
+        title=f'Export vs Import Values by Crop ({year})',
+        xaxis_title='Crop',
+        yaxis_title='Value (Billion USD)',
+        **HOUSE_STYLE,
+        barmode='group'
+    )
+    return fig_trade_compare
+
+
+def fig_net_trade(crop_data, year=BUNDLED_YEAR):
+    # Net trade balance
+    fig_net_trade = px.bar(
+        crop_data,
+        x='Crop',
+        y='Net_Trade_Billion_USD',
+        title=f'Net Trade Balance by Crop ({year})',
+        color='Net_Trade_Billion_USD',
+        color_continuous_scale=['#dc3545', '#ffffff', '#28a745'],
+        labels={'Net_Trade_Billion_USD': 'Net Trade (Billion USD)'}
+    )
+
+    fig_net_trade.add_hline(y=0, line_dash="dash", line_color="black", annotation_text="Trade Balance")
+
+    fig_net_trade.update_layout(
+        **HOUSE_STYLE,
+        showlegend=False
+    )
+    return fig_net_trade
+
+
+def fig_export_trends(export_data, max_points=downsample.MAX_POINTS):
+    fig_export_trends = go.Figure()
+
+    fig_export_trends.add_trace(scatter(
+        **downsample.xy(export_data['Year'], export_data['Palm_Oil_Value_Billion_USD'], max_points),
+        mode='lines+markers',
+        name='Palm Oil',
+        line=dict(color='#2E4057', width=4),
+        marker=dict(size=8)
+    ))
+
+    fig_export_trends.add_trace(scatter(
+        **downsample.xy(export_data['Year'], export_data['Rubber_Value_Billion_USD'], max_points),
+        mode='lines+markers',
+        name='Rubber',
+        line=dict(color='#548CA8', width=4),
+        marker=dict(size=8)
+    ))
+
+    fig_export_trends.update_layout(
+        title='Historical Export Value Growth (1960-2024)',
+        xaxis_title='Year',
+        yaxis_title='Export Value (Billion USD)',
+        **HOUSE_STYLE,
+        hovermode='x unified'
+    )
+    return fig_export_trends
+
+
+def fig_ownership(ownership_data, max_points=downsample.MAX_POINTS):
+    fig_ownership = go.Figure()
+
+    fig_ownership.add_trace(scatter(
+        **downsample.xy(ownership_data['Year'], ownership_data['European_Corporate'], max_points),
+        mode='lines+markers',
+        name='European/Corporate Estates',
+        line=dict(color='#2E4057', width=3),
+        fill='tonexty'
+    ))
+
+    fig_ownership.add_trace(scatter(
+        **downsample.xy(ownership_data['Year'], ownership_data['FELDA_Schemes'], max_points),
+        mode='lines+markers',
+        name='FELDA Schemes',
+        line=dict(color='#548CA8', width=3),
+        fill='tonexty'
+    ))
+
+    fig_ownership.add_trace(scatter(
+        **downsample.xy(ownership_data['Year'], ownership_data['Independent_Smallholders'], max_points),
+        mode='lines+markers',
+        name='Independent Smallholders',
+        line=dict(color='#334257', width=3),
+        fill='tonexty'
+    ))
+
+    fig_ownership.add_trace(scatter(
+        **downsample.xy(ownership_data['Year'], ownership_data['State_Schemes'], max_points),
+        mode='lines+markers',
+        name='State Schemes',
+        line=dict(color='#476072', width=3),
+        fill='tonexty'
+    ))
+
+    fig_ownership.update_layout(
+        title="Land Ownership Distribution Evolution (%)",
+        xaxis_title="Year",
+        yaxis_title="Percentage (%)",
+        **HOUSE_STYLE,
+        hovermode='x unified'
+    )
+    return fig_ownership
+
+
+def fig_export(export_data, max_points=downsample.MAX_POINTS):
+    # Export growth over time
+    fig_export = go.Figure()
+
+    fig_export.add_trace(scatter(
+        **downsample.xy(export_data['Year'], export_data['Palm_Oil_Million_Tonnes'], max_points),
+        mode='lines+markers',
+        name='Palm Oil (Million Tonnes)',
+        line=dict(color='#2E4057', width=3),
+        yaxis='y'
+    ))
+
+    fig_export.add_trace(scatter(
+        **downsample.xy(export_data['Year'], export_data['Rubber_Million_Tonnes'], max_points),
+        mode='lines+markers',
+        name='Rubber (Million Tonnes)',
+        line=dict(color='#548CA8', width=3),
+        yaxis='y'
+    ))
+
+    fig_export.update_layout(
+        title="Agricultural Export Growth (1960-2024)",
+        xaxis_title="Year",
+        yaxis_title="Million Tonnes",
+        **HOUSE_STYLE,
+        hovermode='x unified'
+    )
+    return fig_export
+
+
+def fig_smallholder(crop_data):
+    # Smallholder contribution
+    fig_smallholder = px.bar(
+        crop_data,
+        x='Crop',
+        y='Smallholder_Percentage',
+        title="Smallholder Share by Crop (%)",
+        color='Smallholder_Percentage',
+        color_continuous_scale=['#E8F4FD', '#2E4057']
+    )
+    fig_smallholder.update_layout(
+        **HOUSE_STYLE,
+        showlegend=False
+    )
+    return fig_smallholder
+
+
+def fig_funding(env_funding_data):
+    # Funding sources chart
+    fig_funding = px.bar(
+        env_funding_data,
+        x='Mechanism',
+        y='Amount_Million_USD',
+        title="Major Environmental Funding Sources (Million USD)",
+        color='Focus_Area',
+        color_discrete_sequence=['#2E4057', '#548CA8', '#334257', '#476072', '#8B9DC3', '#A8DADC']
+    )
+    fig_funding.update_layout(
+        **HOUSE_STYLE,
+        xaxis={'categoryorder': 'total descending'}
+    )
+    fig_funding.update_xaxes(tickangle=45)
+    return fig_funding
+
+
+def fig_gap():
+    # Financing gap visualization
+    gap_data = pd.DataFrame({
+        'Year': [2020, 2022, 2024, 2025],
+        'Required': [210, 210, 210, 210],
+        'Available': [88, 118, 135, 158],
+        'Gap': [122, 92, 75, 52]
+    })
+
+    fig_gap = go.Figure()
+    fig_gap.add_trace(scatter(
+        x=gap_data['Year'],
+        y=gap_data['Required'],
+        mode='lines+markers',
+        name='Required ($B annually)',
+        line=dict(color='#dc3545', width=3)
+    ))
+    fig_gap.add_trace(scatter(
+        x=gap_data['Year'],
+        y=gap_data['Available'],
+        mode='lines+markers',
+        name='Available ($B annually)',
+        line=dict(color='#28a745', width=3)
+    ))
+    fig_gap.add_trace(scatter(
+        x=gap_data['Year'],
+        y=gap_data['Gap'],
+        mode='lines+markers',
+        name='Financing Gap ($B)',
+        line=dict(color='#2E4057', width=3)
+    ))
+
+    fig_gap.update_layout(
+        title="Southeast Asia Climate Financing Gap",
+        xaxis_title="Year",
+        yaxis_title="Billion USD",
+        **HOUSE_STYLE
+    )
+    return fig_gap
+
+
+def fig_plastic(plastic_policy_data):
+    fig_plastic = px.bar(
+        plastic_policy_data,
+        x='Metric',
+        y='Percentage',
+        title="Malaysia Plastic Policy Success Metrics",
+        color='Status',
+        color_discrete_map={'Achieved': '#28a745', 'Exceeded': '#2E4057'}
+    )
+    fig_plastic.update_layout(**HOUSE_STYLE)
+    fig_plastic.update_xaxes(tickangle=45)
+    return fig_plastic
+
+
+def fig_ngo(ngo_achievements):
+    fig_ngo = px.bar(
+        ngo_achievements,
+        x='Organization',
+        y='Impact_Score',
+        title="NGO Effectiveness & Impact Scores",
+        color='Impact_Score',
+        color_continuous_scale=['#548CA8', '#2E4057']
+    )
+    fig_ngo.update_layout(
+        **HOUSE_STYLE,
+        showlegend=False
+    )
+    fig_ngo.update_xaxes(tickangle=45)
+    return fig_ngo
+
+
+def fig_timeline(ngo_achievements):
+    # Major achievements timeline
+    achievements_by_year = ngo_achievements.groupby('Year').size().reset_index(name='Count')
+
+    fig_timeline = px.line(
+        achievements_by_year,
+        x='Year',
+        y='Count',
+        title="Environmental Victories Timeline",
+        markers=True,
+        render_mode=render_mode(len(achievements_by_year))
+    )
+    fig_timeline.update_traces(line_color='#2E4057', marker_size=8)
+    fig_timeline.update_layout(**HOUSE_STYLE)
+    return fig_timeline
+
+
+def fig_fires(fire_data_2025, max_points=downsample.MAX_POINTS):
+    fig_fires = go.Figure()
+    fig_fires.add_trace(scatter(
+        **downsample.xy(fire_data_2025['Month'], fire_data_2025['Malaysia_Fires'], max_points),
+        mode='lines+markers',
+        name='Malaysia',
+        line=dict(color='#2E4057', width=3)
+    ))
+    fig_fires.add_trace(scatter(
+        **downsample.xy(fire_data_2025['Month'], fire_data_2025['Indonesia_Fires'], max_points),
+        mode='lines+markers',
+        name='Indonesia',
+        line=dict(color='#dc3545', width=3)
+    ))
+    fig_fires.add_trace(scatter(
+        **downsample.xy(fire_data_2025['Month'], fire_data_2025['Regional_Total'], max_points),
+        mode='lines+markers',
+        name='Regional Total',
+        line=dict(color='#548CA8', width=3)
+    ))
+
+    fig_fires.update_layout(
+        title="2025 Forest Fire Activity by Month",
+        xaxis_title="Month",
+        yaxis_title="Number of Active Fires",
+        **HOUSE_STYLE
+    )
+    return fig_fires
+
+
+def fig_impact():
+    # Impact sectors
+    impact_data = pd.DataFrame({
+        'Sector': ['Health', 'Education', 'Tourism', 'Economy'],
+        'Impact_Percentage': [67, 45, 38, 52],
+        'Description': ['31% increase in hospital cases', 'School closures affecting 2M+ students',
+                      'Significant visitor decline', 'Industrial production delays']
+    })
+
+    fig_impact = px.pie(
+        impact_data,
+        values='Impact_Percentage',
+        names='Sector',
+        title="Haze Impact by Sector (2025)",
+        color_discrete_sequence=['#2E4057', '#548CA8', '#334257', '#476072']
+    )
+    fig_impact.update_layout(**HOUSE_STYLE)
+    return fig_impact
+
+
+if __name__ == '__main__':
+    # Figure JSON bytes as sent to the browser, with the slim template and
+    # with Streamlit's stock one
+    import inspect
+
+    import streamlit  # registers the 'streamlit' template
+    import data_store
+
+    pio.templates.default = 'dashboard'
+    total_slim = total_stock = 0
+    for name, build in sorted(globals().items()):
+        if not name.startswith('fig_'):
+            continue
+        parameters = inspect.signature(build).parameters.values()
+        tables = [p.name for p in parameters if p.default is inspect.Parameter.empty]
+        fig = build(*[data_store.read_table(table) for table in tables])
+        slim = len(pio.to_json(fig, validate=False))
+        stock = len(pio.to_json(fig.update_layout(template='streamlit'), validate=False))
+        total_slim += slim
+        total_stock += stock
+        print(f'{name:20} {stock:8,} -> {slim:7,} bytes')
+    print(f"{'total':20} {total_stock:8,} -> {total_slim:7,} bytes")
@@ -0,0 +1,322 @@
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+import schema
+
+# Columnar on-disk store for the dashboard tables. Each table lives in its own
+# uncompressed Arrow IPC file so it can be opened memory-mapped: pages are only
+# read when a column is touched and are shared between processes through the
+# OS page cache, so cold starts stay flat as the tables grow.
+DATA_DIR = Path(os.environ.get('DASHBOARD_DATA_DIR', Path(__file__).parent / 'data' / 'store'))
+
+TABLES = [
+    'ownership_data',
+    'crop_data',
+    'state_data',
+    'export_data',
+    'felda_data',
+    'env_funding_data',
+    'plastic_policy_data',
+    'fire_data_2025',
+    'ngo_achievements',
+]
+
+# Tables that only exist once real data has been ingested; there is no
+# bundled default for them.
+#   estate_points - one row per estate or FELDA scheme with Name, State,
+#                   Latitude, Longitude and the state_data area/FELDA columns;
+#                   Major_Companies is optional
+OPTIONAL_TABLES = [
+    'estate_points',
+]
+
+
+# Historical ownership data
+def _ownership_data():
+    return pd.DataFrame({
+        'Year': [1920, 1940, 1957, 1980, 2000, 2024],
+        'European_Corporate': [73, 70, 65, 55, 49, 45],
+        'FELDA_Schemes': [0, 0, 5, 15, 25, 33],
+        'Independent_Smallholders': [25, 28, 25, 25, 20, 15],
+        'State_Schemes': [2, 2, 5, 5, 6, 7]
+    })
+
+
+# Enhanced crop data with import/export values
+def _crop_data():
+    return pd.DataFrame({
+        'Crop': ['Oil Palm', 'Rubber', 'Rice', 'Coconut', 'Durian', 'Cocoa', 'Pepper'],
+        'Area_Million_Ha': [5.67, 1.2, 0.68, 0.4, 0.15, 0.05, 0.02],
+        'Export_Value_Billion_USD': [22.3, 3.2, 0.1, 0.5, 1.2, 0.3, 0.15],
+        'Import_Value_Billion_USD': [0.2, 0.1, 2.8, 0.05, 0.02, 0.4, 0.01],
+        'Net_Trade_Billion_USD': [22.1, 3.1, -2.7, 0.45, 1.18, -0.1, 0.14],
+        'Smallholder_Percentage': [45, 94, 85, 78, 60, 96, 75],
+        'Production_Million_Tonnes': [19.3, 0.35, 2.8, 0.6, 0.4, 0.02, 0.025]
+    })
+
+
+# Enhanced state data with FELDA details and corporate presence
+def _state_data():
+    return pd.DataFrame({
+        'State': ['Johor', 'Pahang', 'Perak', 'Selangor', 'Negeri Sembilan',
+                 'Kedah', 'Kelantan', 'Terengganu', 'Sabah', 'Sarawak'],
+        'Oil_Palm_Ha': [750000, 680000, 380000, 280000, 180000,
+                       120000, 140000, 160000, 1500000, 1200000],
+        'Rubber_Ha': [150000, 120000, 200000, 80000, 60000,
+                     100000, 80000, 70000, 200000, 180000],
+        'FELDA_Schemes': [45, 89, 12, 8, 6, 15, 22, 18, 35, 25],
+        'FELDA_Settlers': [112000, 186000, 28000, 18000, 14000,
+                          35000, 52000, 42000, 89000, 64000],
+        'Corporate_Estates_Ha': [400000, 300000, 180000, 150000, 100000,
+                               60000, 70000, 80000, 900000, 750000],
+        'Smallholder_Ha': [500000, 500000, 400000, 210000, 140000,
+                          175000, 150000, 150000, 835000, 630000],
+        'Major_Companies': ['IOI Corp, KLK', 'Felda Global, Genting Plant', 'Kuala Lumpur Kepong',
+                          'Sime Darby', 'IOI Corp', 'Guthrie, TH Plant', 'Felda Global',
+                          'TDM Berhad', 'Wilmar, Sabah Softwoods', 'Shin Yang, Rimbunan Hijau'],
+        'Latitude': [1.4854, 3.8126, 4.5921, 3.0738, 2.7297,
+                    6.1184, 6.1254, 5.3117, 5.9804, 1.5533],
+        'Longitude': [103.7618, 103.3256, 101.0901, 101.5183, 101.9424,
+                     100.3681, 102.2386, 103.1324, 116.0735, 110.3592]
+    })
+
+
+# Export growth data
+def _export_data():
+    return pd.DataFrame({
+        'Year': [1960, 1970, 1980, 1990, 2000, 2010, 2020, 2024],
+        'Palm_Oil_Million_Tonnes': [0.1, 0.8, 4.5, 8.9, 13.2, 17.1, 18.0, 19.3],
+        'Rubber_Million_Tonnes': [1.2, 1.5, 1.8, 1.2, 0.9, 0.8, 0.6, 0.35],
+        'Palm_Oil_Value_Billion_USD': [0.05, 0.4, 2.8, 6.2, 10.8, 16.5, 19.2, 22.3],
+        'Rubber_Value_Billion_USD': [2.1, 2.8, 4.2, 3.8, 2.9, 3.1, 2.8, 3.2]
+    })
+
+
+# FELDA historical data
+def _felda_data():
+    return pd.DataFrame({
+        'Year': [1956, 1960, 1970, 1980, 1990, 2000, 2010, 2024],
+        'Schemes_Opened': [0, 12, 78, 156, 234, 289, 312, 317],
+        'Settlers_Families': [0, 8500, 52000, 89000, 112000, 118000, 112500, 123000],
+        'Land_Developed_Ha': [0, 48000, 312000, 624000, 936000, 1156000, 1248000, 1268000],
+        'Oil_Palm_Ha': [0, 15000, 180000, 450000, 680000, 820000, 860000, 875000]
+    })
+
+
+# Environmental data for new section
+def _env_funding_data():
+    return pd.DataFrame({
+        'Mechanism': ['ACGF', 'Green Climate Fund', 'China-ASEAN Fund', 'ASEAN-Korea Fund', 'Australia GIP', 'Singapore Green Bonds'],
+        'Amount_Million_USD': [1800, 300, 10000, 45, 50, 6000],
+        'Focus_Area': ['Infrastructure', 'Climate Recovery', 'Infrastructure', 'Environment', 'Clean Energy', 'Green Finance'],
+        'Coverage': ['ASEAN-wide', 'SEA Regional', 'ASEAN', 'ASEAN', 'SEA', 'Singapore']
+    })
+
+
+def _plastic_policy_data():
+    return pd.DataFrame({
+        'Metric': ['Plastic Bag Usage Reduction', 'Voluntary Clean-ups Increase', 'Public Awareness Increase', 'Penang Recycling Rate'],
+        'Percentage': [30, 40, 50, 200],
+        'Status': ['Achieved', 'Achieved', 'Achieved', 'Exceeded']
+    })
+
+
+def _fire_data_2025():
+    return pd.DataFrame({
+        'Month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul'],
+        'Malaysia_Fires': [12, 8, 15, 22, 18, 25, 31],
+        'Indonesia_Fires': [45, 38, 89, 156, 134, 187, 245],
+        'Regional_Total': [67, 52, 125, 203, 178, 234, 298]
+    })
+
+
+def _ngo_achievements():
+    return pd.DataFrame({
+        'Organization': ['Greenpeace SEA', 'SAM', 'Kuala Langat Group', 'WWF Malaysia', 'Lost Food Project'],
+        'Achievement': ['Stopped Krabi Coal Plant', 'Right Livelihood Award', 'Closed 300+ illegal facilities', 'Restored 2,400 hectares', 'Prevented 6.78M kg emissions'],
+        'Year': [2021, 1988, 2020, 2024, 2024],
+        'Impact_Score': [95, 90, 85, 88, 82]
+    })
+
+
+# Default dataset shipped with the dashboard, built per table on demand
+BUNDLED = {
+    'ownership_data': _ownership_data,
+    'crop_data': _crop_data,
+    'state_data': _state_data,
+    'export_data': _export_data,
+    'felda_data': _felda_data,
+    'env_funding_data': _env_funding_data,
+    'plastic_policy_data': _plastic_policy_data,
+    'fire_data_2025': _fire_data_2025,
+    'ngo_achievements': _ngo_achievements,
+}
+
+
+def bundled_tables():
+    return {name: build() for name, build in BUNDLED.items()}
+
+
+def table_path(name, data_dir=None):
+    return Path(data_dir or DATA_DIR) / f'{name}.arrow'
+
+
+def write_table(name, df, data_dir=None):
+    path = table_path(name, data_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Stored with the compact dtypes, so loading them needs no conversion
+    table = pa.Table.from_pandas(schema.apply(name, df), preserve_index=False)
+
+    # Write next to the target and swap it in, so a reader never maps a
+    # half-written file
+    tmp_path = path.with_suffix('.arrow.tmp')
+    with pa.OSFile(str(tmp_path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    stamp = file_fingerprint(tmp_path)
+    os.replace(tmp_path, path)
+    write_digest(path, stamp)
+    return path
+
+
+# (path, size, mtime_ns) -> content hash, so a file is only rehashed after
+# it has been rewritten
+_digests = {}
+
+
+def file_fingerprint(path, previous=None):
+    """Size, mtime and content hash of a file.
+
+    The hash is only recomputed when the size or mtime differ from the
+    previous fingerprint, or from the last time this process hashed the file.
+    """
+    stat = os.stat(path)
+    size, mtime_ns = stat.st_size, stat.st_mtime_ns
+    if previous and previous['size'] == size and previous['mtime_ns'] == mtime_ns:
+        return previous
+    key = (str(path), size, mtime_ns)
+    if key not in _digests:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        _digests[key] = digest.hexdigest()
+    return {'size': size, 'mtime_ns': mtime_ns, 'hash': _digests[key]}
+
+
+def _digest_path(path):
+    return Path(f'{path}.digest')
+
+
+def write_digest(path, fingerprint):
+    # Content hash of a file just written, kept next to it so readers can
+    # version the file without hashing it
+    tmp_path = Path(f'{path}.digest.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(fingerprint, f)
+    os.replace(tmp_path, _digest_path(path))
+
+
+def remove_file(path):
+    # A stored file together with its digest
+    Path(path).unlink(missing_ok=True)
+    _digest_path(path).unlink(missing_ok=True)
+
+
+def file_version(path):
+    """Version stamp of a file, from a stat call and no read of its contents.
+
+    The stored content hash while the file still has the size and mtime it
+    was written with, otherwise the size and mtime themselves.
+    """
+    stat = os.stat(path)
+    try:
+        with open(_digest_path(path), encoding='utf-8') as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        stored = None
+    if stored and stored.get('size') == stat.st_size and stored.get('mtime_ns') == stat.st_mtime_ns:
+        return stored['hash']
+    return f'{stat.st_size}-{stat.st_mtime_ns}'
+
+
+def fingerprint(name, data_dir=None):
+    # Version stamp for a stored table; the bundled defaults only change with
+    # the code. Rewriting a table with the same contents keeps its version,
+    # so caches built from it stay valid.
+    path = table_path(name, data_dir)
+    if not path.exists():
+        return 'bundled'
+    return file_version(path)
+
+
+def read_arrow(name, data_dir=None):
+    path = table_path(name, data_dir)
+    if not path.exists():
+        return None
+    # Buffers point straight into the mapping; nothing is copied until a
+    # column is converted
+    return pa.ipc.open_file(pa.memory_map(str(path), 'r')).read_all()
+
+
+def read_table(name, data_dir=None, arrow_backed=False):
+    table = read_arrow(name, data_dir)
+    if table is None:
+        if name not in BUNDLED:
+            return None
+        df = schema.apply(name, BUNDLED[name]())
+        return to_arrow_backed(df) if arrow_backed else df
+    if arrow_backed:
+        return schema.apply_arrow(name, table).to_pandas(types_mapper=pd.ArrowDtype)
+    # split_blocks keeps one block per column so numeric columns without
+    # nulls stay zero-copy views over the mapped file; files written before
+    # the compact dtypes are narrowed here
+    return schema.apply(name, table.to_pandas(split_blocks=True))
+
+
+def to_arrow_backed(df):
+    if all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes):
+        return df
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            # Categoricals as plain Arrow strings (see schema.apply_arrow)
+            table = table.set_column(i, field.name, table.column(i).cast(field.type.value_type))
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def write_bundled(data_dir=None):
+    return [write_table(name, df, data_dir) for name, df in bundled_tables().items()]
+
+
+def memory_report(data_dir=None):
+    """(table, bytes with default dtypes, bytes with compact dtypes) per table."""
+    report = []
+    for name in TABLES + OPTIONAL_TABLES:
+        df = read_table(name, data_dir)
+        if df is not None:
+            report.append((name, schema.memory(schema.widen(df)), schema.memory(df)))
+    return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write the bundled dataset to the columnar store.')
+    parser.add_argument('--data-dir', default=DATA_DIR, type=Path)
+    parser.add_argument('--memory', action='store_true', help='report the memory of each table before and after compact dtypes instead')
+    args = parser.parse_args()
+
+    if args.memory:
+        total_before = total_after = 0
+        for name, before, after in memory_report(args.data_dir):
+            total_before, total_after = total_before + before, total_after + after
+            print(f'{name:<22} {before:>12,} B -> {after:>12,} B  ({(after / before - 1) * 100:+4.0f}%)')
+        print(f'{"total":<22} {total_before:>12,} B -> {total_after:>12,} B  ({(total_after / total_before - 1) * 100:+4.0f}%)')
+    else:
+        for path in write_bundled(args.data_dir):
+            print(f'wrote {path}')
@@ -0,0 +1,123 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+import data_store
+import timings
+import trade_cube
+
+# Registry of named dataset loaders. Sections ask for the tables they need by
+# name, and each table is loaded and cached on its own, so a session only
+# materializes the datasets behind the sections it actually opens.
+LOADERS = {}
+VERSIONS = {}
+
+# With DASHBOARD_SHARED_DATA=1 every table is held once per process through
+# st.cache_resource as an immutable Arrow-backed frame, instead of
+# st.cache_data handing each session a freshly unpickled copy on every rerun.
+SHARED = os.environ.get('DASHBOARD_SHARED_DATA', '').lower() in ('1', 'true', 'yes')
+
+# name -> (frame, snapshot) for the shared tables loaded in this process
+_shared = {}
+
+
+def register(name, version=None):
+    def decorator(func):
+        LOADERS[name] = func
+        if version is not None:
+            VERSIONS[name] = version
+        return func
+    return decorator
+
+
+def _store_loader(name):
+    def load():
+        return data_store.read_table(name, arrow_backed=SHARED)
+    return load
+
+
+def _store_version(name):
+    def version():
+        return data_store.fingerprint(name)
+    return version
+
+
+for _name in data_store.TABLES:
+    register(_name, version=_store_version(_name))(_store_loader(_name))
+
+
+@register('estate_points', version=lambda: (data_store.fingerprint('estate_points'), data_store.fingerprint('state_data')))
+def _estate_points():
+    points = data_store.read_table('estate_points', arrow_backed=SHARED)
+    if points is None:
+        # Without estate-level data each state centroid stands in as a point
+        state_data = data_store.read_table('state_data', arrow_backed=SHARED)
+        state_data = state_data.dropna(subset=['Latitude', 'Longitude'])
+        points = state_data.assign(Name=state_data['State'])
+    elif 'Major_Companies' not in points:
+        # The company list is optional for points; popups show it blank
+        points = points.assign(Major_Companies='')
+    return points
+
+
+# Loads are keyed on the dataset version as well as the name, so a table that
+# changes on disk is reloaded on the next rerun while every other table stays
+# cached
+@register('trade_cube', version=lambda: (trade_cube.fingerprint(), data_store.fingerprint('crop_data')))
+def _trade_cube():
+    return trade_cube.load()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _load(name, version):
+    return LOADERS[name]()
+
+
+def _snapshot(df):
+    # Arrow arrays are immutable, so any write to a shared frame has to swap
+    # array objects in or out; comparing identities is enough to catch it
+    # without rehashing the data on every rerun
+    return (
+        tuple(df.columns),
+        id(df.index),
+        tuple(id(getattr(df[column].array, '_pa_array', df[column].array)) for column in df.columns),
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _load_shared(name, version):
+    value = LOADERS[name]()
+    if not isinstance(value, pd.DataFrame):
+        # Other datasets, like the trade cube, hold read-only arrays already
+        return value, None
+    df = data_store.to_arrow_backed(value)
+    return df, _snapshot(df)
+
+
+def verify_shared():
+    for name, (df, snapshot) in list(_shared.items()):
+        if snapshot is not None and _snapshot(df) != snapshot:
+            # Drop the corrupted copy so the next rerun reloads it cleanly
+            _shared.clear()
+            _load_shared.clear()
+            raise RuntimeError(
+                f"Shared dataset '{name}' was modified in place. Shared datasets are "
+                f"read-only; call .copy() before changing them."
+            )
+
+
+def get(name):
+    if name not in LOADERS:
+        raise KeyError(f"Unknown dataset '{name}'. Registered: {', '.join(sorted(LOADERS))}")
+    with timings.span('load', name):
+        if SHARED:
+            verify_shared()
+            df, snapshot = _load_shared(name, version(name))
+            _shared[name] = (df, snapshot)
+            return df
+        return _load(name, version(name))
+
+
+def version(*names):
+    return tuple(VERSIONS[name]() if name in VERSIONS else 'static' for name in names)
@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Largest-Triangle-Three-Buckets downsampling for line charts. A chart is
+# only a few hundred pixels wide, so sending more points than pixels adds
+# payload and render time without adding detail. LTTB keeps the point in each
+# bucket that spans the largest triangle with its neighbours, which keeps
+# peaks and troughs where plain striding would drop them.
+#
+# The default cap is one point per pixel of a full-width chart.
+MAX_POINTS = int(os.environ.get('DASHBOARD_CHART_WIDTH', 1200))
+
+
+def lttb(x, y, n_out):
+    """Positions of the n_out points LTTB keeps, first and last included."""
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets between the fixed first and last points; the extra
+    # edge at n makes the last point the "next bucket" of the final bucket
+    edges = np.append(np.linspace(1, n - 1, n_out - 1).astype('int64'), n)
+    keep = np.empty(n_out, dtype='int64')
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2]
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.nanargmax(area)) if not np.isnan(area).all() else start
+        keep[i + 1] = a
+    return keep
+
+
+def _positions(x):
+    # LTTB needs numeric x; dates become nanoseconds and labels their order
+    x = pd.Series(x)
+    if pd.api.types.is_datetime64_any_dtype(x):
+        return x.astype('int64').to_numpy()
+    if pd.api.types.is_numeric_dtype(x):
+        return x.to_numpy(dtype='float64')
+    return np.arange(len(x))
+
+
+def xy(x, y, max_points=MAX_POINTS):
+    """x and y of one trace reduced to at most max_points.
+
+    max_points=None keeps every point.
+    """
+    x = pd.Series(x).reset_index(drop=True)
+    y = pd.Series(y).reset_index(drop=True)
+    if max_points is None or len(x) <= max_points:
+        return {'x': x, 'y': y}
+    keep = lttb(_positions(x), y.to_numpy(dtype='float64', na_value=np.nan), max_points)
+    return {'x': x.iloc[keep], 'y': y.iloc[keep]}
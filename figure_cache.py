@@ -0,0 +1,60 @@
+import os
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+import datasets
+import timings
+
+# Process-wide cache of built Plotly figures. Keys combine the figure name,
+# the versions of the datasets it was built from and any widget parameters,
+# so switching between sections is a lookup instead of a full px/go build.
+# The least recently used figures are evicted once the cache is full.
+MAX_FIGURES = int(os.environ.get('DASHBOARD_FIGURE_CACHE_SIZE', 64))
+
+
+class FigureCache:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        with self._lock:
+            if key in self._figures:
+                self._figures.move_to_end(key)
+                self.hits += 1
+                return self._figures[key]
+            self.misses += 1
+
+        # Build outside the lock so a slow figure does not block other sessions
+        fig = build()
+
+        with self._lock:
+            self._figures[key] = fig
+            self._figures.move_to_end(key)
+            while len(self._figures) > self.maxsize:
+                self._figures.popitem(last=False)
+        return fig
+
+    def __len__(self):
+        return len(self._figures)
+
+
+@st.cache_resource(show_spinner=False)
+def _figure_cache():
+    return FigureCache(MAX_FIGURES)
+
+
+def figure(name, tables, build, **params):
+    key = (name, datasets.version(*tables), tuple(sorted(params.items())))
+
+    def timed_build():
+        # Only cache misses are timed; hits cost a dictionary lookup
+        with timings.span('build', name):
+            return build(**params)
+
+    return _figure_cache().get(key, timed_build)
@@ -0,0 +1,320 @@
+import argparse
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+import data_store
+import trade_cube
+
+# Folds monthly MPOB/DOSM CSV exports into the state_data, crop_data and
+# export_data tables of the store. Files are read CHUNK_ROWS rows at a time
+# and each chunk is reduced to a small running aggregate right away, so peak
+# memory depends on the chunk size and the number of states, crops and years,
+# not on the size of the files.
+#
+# Expected columns, one row per month (YYYY-MM) and key:
+#
+#   area        Month, State, Crop, Ownership, Hectares
+#               (Ownership is Corporate, Smallholder or FELDA)
+#   production  Month, State, Crop, Tonnes
+#   trade       Month, Crop, Flow, Tonnes, Value_USD and optionally Partner
+#               (Flow is Export or Import; Partner defaults to World)
+CHUNK_ROWS = int(os.environ.get('DASHBOARD_INGEST_CHUNK_ROWS', 100_000))
+
+SCHEMAS = {
+    'area': {'Month': 'string', 'State': 'category', 'Crop': 'category', 'Ownership': 'category', 'Hectares': 'float64'},
+    'production': {'Month': 'string', 'State': 'category', 'Crop': 'category', 'Tonnes': 'float64'},
+    'trade': {'Month': 'string', 'Crop': 'category', 'Partner': 'category', 'Flow': 'category', 'Tonnes': 'float64', 'Value_USD': 'float64'},
+}
+
+# Columns a source may leave out, with the value they default to
+OPTIONAL_COLUMNS = {
+    'trade': {'Partner': trade_cube.WORLD},
+}
+
+# Crops with their own columns in state_data and export_data
+PALM_OIL = 'Oil Palm'
+RUBBER = 'Rubber'
+
+
+def read_chunks(path, kind, chunk_rows=None):
+    header = pd.read_csv(path, nrows=0).columns
+    missing = {column: default for column, default in OPTIONAL_COLUMNS.get(kind, {}).items() if column not in header}
+    schema = {column: dtype for column, dtype in SCHEMAS[kind].items() if column not in missing}
+    for chunk in pd.read_csv(path, usecols=list(schema), dtype=schema, chunksize=chunk_rows or CHUNK_ROWS):
+        chunk = chunk.dropna(subset=list(schema)).assign(**missing)
+        chunk['Month'] = chunk['Month'].str.slice(0, 7)
+        yield chunk
+
+
+def reduce_area(chunk):
+    # Area is a stock, not a flow: keep only the latest month reported for
+    # each state, crop and ownership
+    latest = chunk.sort_values('Month').groupby(['State', 'Crop', 'Ownership'], observed=True).tail(1)
+    return latest.astype({'State': str, 'Crop': str, 'Ownership': str})
+
+
+def merge_area(total, part):
+    latest = pd.concat([total, part], ignore_index=True).sort_values('Month', kind='stable')
+    return latest.drop_duplicates(['State', 'Crop', 'Ownership'], keep='last').reset_index(drop=True)
+
+
+def reduce_production(chunk):
+    return (
+        chunk.assign(Year=chunk['Month'].str.slice(0, 4).astype('int64'))
+        .groupby(['Year', 'Crop'], observed=True, as_index=False)['Tonnes'].sum()
+        .astype({'Crop': str})
+    )
+
+
+def merge_production(total, part):
+    return pd.concat([total, part]).groupby(['Year', 'Crop'], as_index=False)['Tonnes'].sum()
+
+
+def reduce_trade(chunk):
+    return (
+        chunk.assign(Year=chunk['Month'].str.slice(0, 4).astype('int64'))
+        .groupby(['Year', 'Crop', 'Partner', 'Flow'], observed=True, as_index=False)[['Tonnes', 'Value_USD']].sum()
+        .astype({'Crop': str, 'Partner': str, 'Flow': str})
+    )
+
+
+def merge_trade(total, part):
+    return pd.concat([total, part]).groupby(['Year', 'Crop', 'Partner', 'Flow'], as_index=False)[['Tonnes', 'Value_USD']].sum()
+
+
+# kind -> (reduce one chunk, merge two reduced aggregates). Merging is
+# associative, so per-file aggregates can be combined in any grouping.
+FOLDS = {
+    'area': (reduce_area, merge_area),
+    'production': (reduce_production, merge_production),
+    'trade': (reduce_trade, merge_trade),
+}
+
+# Source kinds each store table is computed from
+DEPENDENCIES = {
+    'state_data': ['area'],
+    'crop_data': ['area', 'production', 'trade'],
+    'export_data': ['trade'],
+}
+
+
+def combine(kind, parts):
+    merge = FOLDS[kind][1]
+    total = None
+    for part in parts:
+        total = part if total is None else merge(total, part)
+    return total
+
+
+def aggregate(kind, paths, chunk_rows=None):
+    """Fold every chunk of every file of one kind into a single aggregate."""
+    reduce = FOLDS[kind][0]
+    return combine(kind, (reduce(chunk) for path in paths for chunk in read_chunks(path, kind, chunk_rows)))
+
+
+def _update(base, key, values, defaults=None):
+    # Overwrite the columns in values for the rows of base they match on key;
+    # rows, columns and missing values they do not cover are left as they
+    # were. Keys base does not have yet are appended, with defaults for the
+    # columns values lack.
+    base = base.set_index(key)
+    values = values.set_index(key)
+    new = values.index.difference(base.index, sort=False)
+    if len(new):
+        added = pd.DataFrame(defaults or {}, index=new).reindex(columns=base.columns)
+        base = pd.concat([base, added])
+        base.index.name = key
+    for column in values.columns:
+        base[column] = base[column].astype('float64')
+        present = values[column].dropna()
+        base.loc[present.index, column] = present
+    return base.reset_index()
+
+
+# Columns of a state that first appears in the exports; it has no
+# coordinates, so it is left off the map until they are filled in
+NEW_STATE = {'FELDA_Schemes': 0, 'FELDA_Settlers': 0, 'Major_Companies': ''}
+
+
+def state_table(base, area):
+    ha = area.pivot_table(index='State', columns='Crop', values='Hectares', aggfunc='sum', fill_value=0)
+    # Ownership over the same two crops as Oil_Palm_Ha + Rubber_Ha, so the
+    # ownership shares derived from them stay within 100%
+    tree_crops = area[area['Crop'].isin([PALM_OIL, RUBBER])]
+    owned = tree_crops.pivot_table(index='State', columns='Ownership', values='Hectares', aggfunc='sum', fill_value=0)
+    owned = owned.reindex(ha.index, fill_value=0)
+    values = pd.DataFrame(index=ha.index)
+    if PALM_OIL in ha:
+        values['Oil_Palm_Ha'] = ha[PALM_OIL]
+    if RUBBER in ha:
+        values['Rubber_Ha'] = ha[RUBBER]
+    if 'Corporate' in owned:
+        values['Corporate_Estates_Ha'] = owned['Corporate']
+    if 'Smallholder' in owned:
+        values['Smallholder_Ha'] = owned['Smallholder']
+    return _update(base, 'State', values.round().reset_index(), NEW_STATE)
+
+
+def crop_table(base, area=None, production=None, trade=None):
+    values = pd.DataFrame(index=pd.Index([], name='Crop'))
+    if area is not None:
+        by_crop = area.groupby('Crop')['Hectares'].sum()
+        smallholder = area[area['Ownership'] == 'Smallholder'].groupby('Crop')['Hectares'].sum()
+        values = values.reindex(values.index.union(by_crop.index))
+        values['Area_Million_Ha'] = (by_crop / 1e6).round(2)
+        values['Smallholder_Percentage'] = (smallholder.reindex(by_crop.index, fill_value=0) / by_crop * 100).round()
+    if production is not None:
+        latest = production[production['Year'] == production['Year'].max()].set_index('Crop')['Tonnes']
+        values = values.reindex(values.index.union(latest.index))
+        values['Production_Million_Tonnes'] = (latest / 1e6).round(3)
+    if trade is not None:
+        latest = trade[trade['Year'] == trade['Year'].max()]
+        flows = latest.pivot_table(index='Crop', columns='Flow', values='Value_USD', aggfunc='sum').reindex(columns=['Export', 'Import'])
+        flows = (flows.fillna(0) / 1e9).round(2)
+        values = values.reindex(values.index.union(flows.index))
+        values['Export_Value_Billion_USD'] = flows['Export']
+        values['Import_Value_Billion_USD'] = flows['Import']
+        values['Net_Trade_Billion_USD'] = (flows['Export'] - flows['Import']).round(2)
+    return _update(base, 'Crop', values.reset_index())
+
+
+def export_table(base, trade):
+    exports = trade[trade['Flow'] == 'Export']
+    yearly = pd.DataFrame({
+        'Palm_Oil_Million_Tonnes': exports[exports['Crop'] == PALM_OIL].groupby('Year')['Tonnes'].sum() / 1e6,
+        'Rubber_Million_Tonnes': exports[exports['Crop'] == RUBBER].groupby('Year')['Tonnes'].sum() / 1e6,
+        'Palm_Oil_Value_Billion_USD': exports[exports['Crop'] == PALM_OIL].groupby('Year')['Value_USD'].sum() / 1e9,
+        'Rubber_Value_Billion_USD': exports[exports['Crop'] == RUBBER].groupby('Year')['Value_USD'].sum() / 1e9,
+    }).fillna(0).round(2)
+    # Ingested years replace the bundled ones; earlier history is kept
+    history = base[~base['Year'].isin(yearly.index)]
+    return pd.concat([history, yearly.rename_axis('Year').reset_index()], ignore_index=True).sort_values('Year', ignore_index=True)
+
+
+def build_tables(aggregates, tables=None):
+    """Store tables recomputed from the aggregates of each source kind.
+
+    Every table starts again from its bundled default, so the rows of a
+    source file that was removed, or of years a file no longer covers, do
+    not linger; a table without any sources left goes back to the default.
+    """
+    area = aggregates.get('area')
+    production = aggregates.get('production')
+    trade = aggregates.get('trade')
+    built = {
+        'state_data': lambda base: state_table(base, area) if area is not None else base,
+        'crop_data': lambda base: crop_table(base, area, production, trade),
+        'export_data': lambda base: export_table(base, trade) if trade is not None else base,
+    }
+    return {
+        name: build(data_store.BUNDLED[name]())
+        for name, build in built.items() if tables is None or name in tables
+    }
+
+
+# Every source file ingested so far, with its fingerprint and the path of its
+# stored aggregate. Later runs only re-read files whose fingerprint changed.
+MANIFEST = 'ingest_manifest.json'
+
+
+# Bumped whenever the layout of the stored per-file aggregates changes, so
+# aggregates written by an older version are recomputed instead of reused
+AGGREGATE_VERSION = 2
+
+
+def _part_name(kind, file_hash):
+    return f'{kind}-v{AGGREGATE_VERSION}-{file_hash}'
+
+
+def _manifest_path(data_dir=None):
+    return Path(data_dir or data_store.DATA_DIR) / MANIFEST
+
+
+def load_manifest(data_dir=None):
+    path = _manifest_path(data_dir)
+    if not path.exists():
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, data_dir=None):
+    path = _manifest_path(data_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def ingest(sources=None, data_dir=None, chunk_rows=None, force=False):
+    """Fold new or changed source files ({kind: [paths]}) into the store.
+
+    Files from earlier runs stay part of the dataset. Each file's aggregate
+    is stored next to the tables, so only files whose size, mtime and hash
+    changed are read again, and only the tables that depend on their kinds
+    are rewritten. Files that have disappeared are dropped.
+    """
+    parts_dir = Path(data_dir or data_store.DATA_DIR) / 'aggregates'
+    manifest = load_manifest(data_dir)
+    for kind, paths in (sources or {}).items():
+        for path in paths:
+            manifest.setdefault(str(Path(path).resolve()), {'kind': kind})
+
+    changed = set()
+    parts = {}
+    for path, entry in sorted(manifest.items()):
+        kind = entry['kind']
+        if not os.path.exists(path):
+            if 'fingerprint' in entry:
+                data_store.remove_file(data_store.table_path(_part_name(kind, entry['fingerprint']['hash']), parts_dir))
+            del manifest[path]
+            changed.add(kind)
+            continue
+        previous = entry.get('fingerprint')
+        current = data_store.file_fingerprint(path, previous)
+        part_name = _part_name(kind, current['hash'])
+        part = None if force else data_store.read_table(part_name, parts_dir)
+        if part is None or previous is None or previous['hash'] != current['hash']:
+            if part is None:
+                part = aggregate(kind, [path], chunk_rows)
+                data_store.write_table(part_name, part, parts_dir)
+            changed.add(kind)
+        if previous and previous['hash'] != current['hash']:
+            data_store.remove_file(data_store.table_path(_part_name(kind, previous['hash']), parts_dir))
+        entry['fingerprint'] = current
+        parts.setdefault(kind, []).append(part)
+
+    stale = [name for name, kinds in DEPENDENCIES.items() if changed.intersection(kinds)]
+    aggregates = {kind: combine(kind, kind_parts) for kind, kind_parts in parts.items()}
+    tables = build_tables(aggregates, stale)
+    written = [data_store.write_table(name, df, data_dir) for name, df in tables.items()]
+    if 'trade' in changed:
+        if aggregates.get('trade') is not None:
+            written.append(trade_cube.TradeCube.from_frame(aggregates['trade']).save(data_dir))
+        else:
+            # Without trade exports the cube is built from crop_data again
+            data_store.remove_file(trade_cube.cube_path(data_dir))
+    save_manifest(manifest, data_dir)
+    return written
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Fold monthly MPOB/DOSM CSV exports into the columnar store.')
+    for kind in SCHEMAS:
+        parser.add_argument(f'--{kind}', nargs='+', default=[], type=Path, help=f"{kind} CSVs ({', '.join(SCHEMAS[kind])})")
+    parser.add_argument('--data-dir', default=data_store.DATA_DIR, type=Path)
+    parser.add_argument('--chunk-rows', default=CHUNK_ROWS, type=int)
+    parser.add_argument('--force', action='store_true', help='re-read every source file')
+    args = parser.parse_args()
+
+    # With no files given, the files from earlier runs are checked for changes
+    sources = {kind: getattr(args, kind) for kind in SCHEMAS}
+    written = ingest(sources, args.data_dir, args.chunk_rows, args.force)
+    for path in written:
+        print(f'wrote {path}')
+    if not written:
+        print('store is up to date')
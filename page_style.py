@@ -0,0 +1,51 @@
+import hashlib
+import shutil
+from pathlib import Path
+
+import streamlit as st
+
+import tile_server
+
+# The dashboard stylesheet is a static file linked by a URL that carries its
+# content hash, and each rerun only sends a short <link> tag instead of the
+# whole <style> block. Streamlit drops elements a run does not emit again, so
+# the tag is still sent on full reruns; fragment reruns leave it alone.
+#
+# Only the offline asset server sends a long-lived Cache-Control. Streamlit's
+# /app/static/ route sends none, just ETag and Last-Modified, so there the
+# browser revalidates the file (a 304 while it is unchanged) rather than
+# keeping it outright.
+CSS_FILE = Path(__file__).parent / 'static' / 'dashboard.css'
+
+
+@st.cache_resource(show_spinner=False)
+def _digest(mtime_ns):
+    return hashlib.blake2b(CSS_FILE.read_bytes(), digest_size=6).hexdigest()
+
+
+def css_url():
+    """URL of the stylesheet, or None when there is nowhere to serve it from."""
+    digest = _digest(CSS_FILE.stat().st_mtime_ns)
+    if tile_server.enabled():
+        # The local asset server answers with a week-long immutable
+        # Cache-Control, keyed by the hashed file name
+        name = f'dashboard.{digest}.css'
+        path = Path(tile_server.ASSET_DIR) / name
+        if not path.is_file():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(CSS_FILE, path)
+        return f'{tile_server.PUBLIC_URL}/assets/{name}'
+    if st.get_option('server.enableStaticServing'):
+        # Revalidated on each page load; the hash only makes a changed file
+        # bypass any cached copy
+        return f'app/static/{CSS_FILE.name}?v={digest}'
+    return None
+
+
+def inject():
+    url = css_url()
+    if url is None:
+        # Static serving is off (.streamlit/config.toml was not picked up)
+        st.markdown(f'<style>{CSS_FILE.read_text()}</style>', unsafe_allow_html=True)
+        return
+    st.markdown(f'<link rel="stylesheet" href="{url}">', unsafe_allow_html=True)
@@ -0,0 +1,471 @@
+import json
+import os
+import string
+
+from branca.colormap import LinearColormap
+import folium
+from folium.plugins import FastMarkerCluster
+from folium.template import Template
+import numpy as np
+import pandas as pd
+
+import tile_server
+
+# How the map is put on the page:
+#   html   - cached rendered HTML in a static iframe; panning and zooming
+#            never talk to the server (default)
+#   folium - st_folium with no returned objects, so interacting with the map
+#            does not rerun the script
+#   viewport - st_folium returning bounds and zoom; markers are culled to the
+#              view on the server (see viewport_layer)
+MAP_MODE = os.environ.get('DASHBOARD_MAP_MODE', 'html')
+
+# How points are drawn:
+#   markers - one CircleMarker and DivIcon label per row
+#   points  - every point in one clustered layer; rows ship as compact arrays
+#             and markers and popups are created in the browser
+#   auto    - points once there are more than POINT_LAYER_THRESHOLD rows
+MAP_LAYER = os.environ.get('DASHBOARD_MAP_LAYER', 'auto')
+POINT_LAYER_THRESHOLD = int(os.environ.get('DASHBOARD_POINT_LAYER_THRESHOLD', 500))
+
+# Viewport culling (DASHBOARD_MAP_MODE=viewport). st_folium reports the map
+# bounds and zoom; below STATE_ZOOM the map shows the state centroids, closer
+# in only the points inside the view plus VIEWPORT_MARGIN on every side are
+# sent, rolled up into grid cells beyond MAX_VIEWPORT_POINTS.
+STATE_ZOOM = 8
+VIEWPORT_MARGIN = 0.25
+MAX_VIEWPORT_POINTS = int(os.environ.get('DASHBOARD_MAX_VIEWPORT_POINTS', 400))
+SUMMED_COLUMNS = ['Oil_Palm_Ha', 'Rubber_Ha', 'FELDA_Schemes', 'FELDA_Settlers', 'Corporate_Estates_Ha', 'Smallholder_Ha']
+
+ZOOM_START = 6
+
+# Fill scale for the ownership choropleth (corporate estate share)
+OWNERSHIP_COLORMAP = LinearColormap(['#E8F4FD', '#2E4057'], vmin=0, vmax=100)
+OWNERSHIP_COLORMAP.caption = 'Corporate estate share of plantation area (%)'
+
+
+# Popup templates per map view. They are compiled once into literal/field
+# pairs and rendered for every state at once by concatenating columns.
+POPUP_TEMPLATES = {
+    "Ownership Structure": """
+            <div style="font-family: Times New Roman; width: 300px;">
+                <h4 style="color: #2E4057; margin-bottom: 10px;">{Name} - Ownership Structure</h4>
+                <p><strong>🏢 Corporate Estates:</strong> {Corporate_Estates_Ha} ha ({corporate_pct}%)</p>
+                <p><strong>🏛️ FELDA Schemes:</strong> {FELDA_Schemes} schemes, {FELDA_Settlers} families</p>
+                <p><strong>👨‍🌾 Smallholders:</strong> {Smallholder_Ha} ha ({smallholder_pct}%)</p>
+                <p><strong>🌴 Total Oil Palm:</strong> {Oil_Palm_Ha} ha</p>
+                <p><strong>🔴 Total Rubber:</strong> {Rubber_Ha} ha</p>
+                <hr>
+                <p><strong>Major Companies:</strong> {Major_Companies}</p>
+            </div>
+            """,
+    "FELDA Distribution": """
+            <div style="font-family: Times New Roman; width: 280px;">
+                <h4 style="color: #548CA8; margin-bottom: 10px;">{Name} - FELDA Programs</h4>
+                <p><strong>📊 FELDA Schemes:</strong> {FELDA_Schemes}</p>
+                <p><strong>👨‍👩‍👧‍👦 Settler Families:</strong> {FELDA_Settlers}</p>
+                <p><strong>💰 Est. Annual Income:</strong> ${est_income}</p>
+                <p><strong>🏠 Communities Established:</strong> {communities}</p>
+                <p><strong>🎓 Schools Built:</strong> {schools}</p>
+                <p><strong>🏥 Health Clinics:</strong> {FELDA_Schemes}</p>
+            </div>
+            """,
+    "Corporate Presence": """
+            <div style="font-family: Times New Roman; width: 280px;">
+                <h4 style="color: #334257; margin-bottom: 10px;">{Name} - Corporate Plantations</h4>
+                <p><strong>🏢 Estate Area:</strong> {Corporate_Estates_Ha} hectares</p>
+                <p><strong>📈 Est. Production:</strong> {est_production} tonnes CPO/year</p>
+                <p><strong>💼 Major Corporations:</strong></p>
+                <p style="font-size: 0.9em;">{Major_Companies}</p>
+                <p><strong>👷 Est. Employment:</strong> {est_employment} workers</p>
+                <p><strong>🏭 Processing Mills:</strong> {mills} facilities</p>
+            </div>
+            """,
+}
+
+LABEL_TEMPLATE = '<div style="font-family: Times New Roman; font-size: 11px; color: {color}; font-weight: bold; text-shadow: 1px 1px 1px white;">{Name}</div>'
+
+COLORS = {
+    "Ownership Structure": '#2E4057',
+    "FELDA Distribution": '#548CA8',
+    "Corporate Presence": '#334257',
+}
+
+
+def compile_template(template):
+    return [(literal, field) for literal, field, _, _ in string.Formatter().parse(template)]
+
+
+def render_template(parts, columns):
+    html = pd.Series('', index=columns.index, dtype=str)
+    for literal, field in parts:
+        html = html + literal
+        if field is not None:
+            html = html + columns[field]
+    return html
+
+
+COMPILED_POPUPS = {map_type: compile_template(template) for map_type, template in POPUP_TEMPLATES.items()}
+COMPILED_LABEL = compile_template(LABEL_TEMPLATE)
+
+
+# Field formatters work on whole columns and return string columns. The
+# arithmetic stays in NumPy; only the final number-to-text step touches
+# Python, on plain lists rather than DataFrame rows. Missing values are
+# shown as MISSING rather than failing the whole map.
+MISSING = 'n/a'
+
+
+def _whole(values):
+    # Nullable integers, so a gap in a count or area stays a gap
+    return pd.to_numeric(values).astype('float64').round().astype('Int64')
+
+
+def _thousands(values):
+    return pd.Series([MISSING if value is pd.NA else f'{value:,}' for value in values.tolist()], index=values.index, dtype=str)
+
+
+def _plain(values):
+    return pd.Series([MISSING if value is pd.NA else str(value) for value in values.tolist()], index=values.index, dtype=str)
+
+
+def _one_decimal(values):
+    numbers = values.to_numpy(dtype='float64', na_value=np.nan)
+    return pd.Series(np.where(np.isnan(numbers), MISSING, np.char.mod('%.1f', numbers)), index=values.index, dtype=str)
+
+
+def map_columns(state_data):
+    """Derived values and formatted popup fields for every state, computed column-wise."""
+    # States added by an ingest have no coordinates until they are filled in
+    state_data = state_data.dropna(subset=['Latitude', 'Longitude'])
+    corporate = _whole(state_data['Corporate_Estates_Ha'])
+    schemes = _whole(state_data['FELDA_Schemes'])
+    settlers = _whole(state_data['FELDA_Settlers'])
+    total_ha = state_data['Oil_Palm_Ha'] + state_data['Rubber_Ha']
+
+    corporate_pct = state_data['Corporate_Estates_Ha'] / total_ha * 100
+    smallholder_pct = state_data['Smallholder_Ha'] / total_ha * 100
+
+    return pd.DataFrame({
+        'Name': state_data['Name' if 'Name' in state_data else 'State'].astype(str),
+        'Major_Companies': state_data['Major_Companies'].fillna('').astype(str),
+        'Latitude': state_data['Latitude'].astype('float64'),
+        'Longitude': state_data['Longitude'].astype('float64'),
+        # Circle size based on total plantation area, counting what is known
+        'radius': (state_data[['Oil_Palm_Ha', 'Rubber_Ha']].sum(axis=1) / 100000 + 8).astype('float64'),
+        'corporate_pct': _one_decimal(corporate_pct),
+        'smallholder_pct': _one_decimal(smallholder_pct),
+        'Corporate_Estates_Ha': _thousands(corporate),
+        'Smallholder_Ha': _thousands(_whole(state_data['Smallholder_Ha'])),
+        'Oil_Palm_Ha': _thousands(_whole(state_data['Oil_Palm_Ha'])),
+        'Rubber_Ha': _thousands(_whole(state_data['Rubber_Ha'])),
+        'FELDA_Schemes': _plain(schemes),
+        'FELDA_Settlers': _thousands(settlers),
+        'est_income': _thousands(settlers * 12000),
+        'communities': _plain(schemes * 3),
+        'schools': _plain(schemes * 2),
+        'est_production': _thousands(corporate * 20),
+        'est_employment': _thousands(corporate // 10),
+        'mills': _plain((corporate // 50000).clip(lower=1)),
+    }, index=state_data.index)
+
+
+class PointLayer(FastMarkerCluster):
+    # FastMarkerCluster, but markers are handed to the cluster in one
+    # addLayers call so chunkedLoading can spread the work across frames
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = (function(){
+                {{ this.callback }}
+
+                var data = {{ this.data|tojson }};
+                var cluster = L.markerClusterGroup({{ this.options|tojavascript }});
+                var markers = new Array(data.length);
+                for (var i = 0; i < data.length; i++) {
+                    markers[i] = callback(data[i]);
+                }
+                cluster.addLayers(markers);
+
+                cluster.addTo({{ this._parent.get_name() }});
+                return cluster;
+            })();
+        {% endmacro %}"""
+    )
+
+
+POINT_CALLBACK = """(function () {
+    var parts = %(parts)s;
+    return function (row) {
+        var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+            radius: row[2], color: '%(color)s', fillColor: '%(color)s', fillOpacity: 0.6, weight: 3
+        });
+        marker.bindPopup(function () {
+            var html = '';
+            for (var i = 0; i < parts.length; i++) {
+                html += parts[i][0];
+                if (parts[i][1] >= 0) { html += row[3 + parts[i][1]]; }
+            }
+            return html;
+        }, {maxWidth: 350});
+        return marker;
+    };
+})()"""
+
+
+def layer_for(points):
+    if MAP_LAYER == 'auto':
+        return 'points' if len(points) > POINT_LAYER_THRESHOLD else 'markers'
+    return MAP_LAYER
+
+
+def add_point_layer(m, columns, map_type):
+    # Each row is [lat, lon, radius, field values...]; the popup template is
+    # sent once as literal/field-index pairs and filled in on popup open
+    fields = []
+    parts = []
+    for literal, field in COMPILED_POPUPS[map_type]:
+        if field is not None and field not in fields:
+            fields.append(field)
+        parts.append([literal, fields.index(field) if field is not None else -1])
+
+    rows = columns[['Latitude', 'Longitude', 'radius'] + fields].copy()
+    rows[['Latitude', 'Longitude']] = rows[['Latitude', 'Longitude']].round(5)
+    rows['radius'] = rows['radius'].round(1)
+    data = rows.to_numpy(dtype=object).tolist()
+    callback = POINT_CALLBACK % {'parts': json.dumps(parts), 'color': COLORS[map_type]}
+    PointLayer(data, callback=callback, chunkedLoading=True).add_to(m)
+
+
+def base_map(map_type, choropleth=False):
+    # Create base map, on the local tile server when one is configured
+    if tile_server.enabled():
+        tiles = {'tiles': tile_server.tiles_url(), 'attr': tile_server.ATTRIBUTION}
+    else:
+        tiles = {'tiles': 'OpenStreetMap'}
+    m = folium.Map(
+        location=[4.2105, 101.9758],
+        zoom_start=ZOOM_START,
+        **tiles
+    )
+    add_legend(m, map_type)
+    if choropleth:
+        OWNERSHIP_COLORMAP.add_to(m)
+    return tile_server.localize_assets(m)
+
+
+def build_map(state_data, map_type, layer='markers', choropleth=None):
+    m = base_map(map_type, choropleth=choropleth is not None)
+    if choropleth is not None:
+        add_choropleth(m, choropleth)
+    columns = map_columns(state_data)
+    if layer == 'points':
+        add_point_layer(m, columns, map_type)
+    else:
+        add_markers(m, columns, map_type)
+    return tile_server.localize_assets(m)
+
+
+def _region_key(names):
+    return names.astype(str).str.lower().str.replace(r'[^a-z]', '', regex=True)
+
+
+def ownership_choropleth(state_data, geojson):
+    """Boundary features joined to the ownership shares of their state.
+
+    Regions are matched on their name with case, spaces and punctuation
+    ignored; regions without data are left out.
+    """
+    total_ha = state_data['Oil_Palm_Ha'] + state_data['Rubber_Ha']
+    shares = pd.DataFrame({
+        'State': state_data['State'].astype(str),
+        'corporate_pct': (state_data['Corporate_Estates_Ha'] / total_ha * 100).astype('float64').round(1),
+        'smallholder_pct': (state_data['Smallholder_Ha'] / total_ha * 100).astype('float64').round(1),
+        # There are no FELDA hectares per state, so the schemes are counted
+        # rather than shown as the share left over by the other two
+        'felda_schemes': _plain(_whole(state_data['FELDA_Schemes'])),
+    })
+    shares['fill'] = [OWNERSHIP_COLORMAP(value) for value in shares['corporate_pct'].clip(0, 100)]
+    shares.index = _region_key(shares['State'])
+
+    names = pd.Series([feature['properties']['name'] for feature in geojson['features']])
+    matched = shares.reindex(_region_key(names))
+    features = [
+        {'type': 'Feature', 'properties': props, 'geometry': feature['geometry']}
+        for feature, props, found in zip(
+            geojson['features'], matched.to_dict('records'), matched['State'].notna()
+        )
+        if found
+    ]
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def add_choropleth(parent, collection):
+    folium.GeoJson(
+        collection,
+        name='Ownership shares',
+        style_function=lambda feature: {
+            'fillColor': feature['properties']['fill'],
+            'color': '#2E4057',
+            'weight': 1,
+            'fillOpacity': 0.55,
+        },
+        tooltip=folium.GeoJsonTooltip(
+            fields=['State', 'corporate_pct', 'smallholder_pct', 'felda_schemes'],
+            aliases=['State', 'Corporate estates (%)', 'Smallholders (%)', 'FELDA schemes'],
+        ),
+    ).add_to(parent)
+
+
+def add_markers(parent, columns, map_type, labels=True):
+    color = COLORS[map_type]
+    popups = render_template(COMPILED_POPUPS[map_type], columns)
+    label_html = render_template(COMPILED_LABEL, columns.assign(color=color))
+
+    # Add state data based on selected view
+    for lat, lon, radius, popup_content, label in zip(
+        columns['Latitude'], columns['Longitude'], columns['radius'], popups, label_html
+    ):
+        folium.CircleMarker(
+            location=[lat, lon],
+            radius=radius,
+            popup=folium.Popup(popup_content, max_width=350),
+            color=color,
+            fillColor=color,
+            fillOpacity=0.6,
+            weight=3
+        ).add_to(parent)
+
+        # Add state labels
+        if labels:
+            folium.Marker(
+                location=[lat, lon],
+                icon=folium.DivIcon(
+                    html=label,
+                    icon_size=(60, 20),
+                    icon_anchor=(30, 10)
+                )
+            ).add_to(parent)
+
+
+def padded_bounds(bounds, margin=VIEWPORT_MARGIN):
+    south, west = bounds['_southWest']['lat'], bounds['_southWest']['lng']
+    north, east = bounds['_northEast']['lat'], bounds['_northEast']['lng']
+    pad_lat = (north - south) * margin
+    pad_lon = (east - west) * margin
+    return south - pad_lat, west - pad_lon, north + pad_lat, east + pad_lon
+
+
+def _has_view(view):
+    bounds = (view or {}).get('bounds') or {}
+    corners = [bounds.get('_southWest') or {}, bounds.get('_northEast') or {}]
+    return view.get('zoom') is not None and all(c.get('lat') is not None and c.get('lng') is not None for c in corners)
+
+
+def roll_up(points, extent, max_points=MAX_VIEWPORT_POINTS):
+    # Merge points into square cells sized so the padded view holds at most
+    # about max_points of them; each cell becomes one marker at the mean
+    # position carrying the summed areas and counts
+    south, west, north, east = extent
+    cell = max(north - south, east - west) / np.sqrt(max_points)
+    keys = (
+        (points['Latitude'].to_numpy(dtype='float64') // cell).astype('int64') * 1_000_000
+        + (points['Longitude'].to_numpy(dtype='float64') // cell).astype('int64')
+    )
+    grouped = points.groupby(keys, sort=False)
+    cells = grouped[SUMMED_COLUMNS].sum()
+    cells[['Latitude', 'Longitude']] = grouped[['Latitude', 'Longitude']].mean()
+    counts = grouped.size()
+    states = grouped['State'].first().astype(str)
+    cells['State'] = states
+    cells['Name'] = counts.astype(str) + ' sites, ' + states
+    cells['Major_Companies'] = grouped['Major_Companies'].agg(lambda names: ', '.join(dict.fromkeys(names.astype(str))))
+    return cells.reset_index(drop=True)
+
+
+def view_zoom(view):
+    return view['zoom'] if _has_view(view) else ZOOM_START
+
+
+def viewport_layer(state_data, points, index, map_type, view, choropleth=None):
+    """Markers for the current st_folium view and the extent they cover.
+
+    Below STATE_ZOOM, or before the first view comes back from the browser,
+    the layer is the state centroids. Closer in, points inside the view plus
+    a margin are looked up in the grid index and sent individually, or
+    rolled up into cells when there are more than MAX_VIEWPORT_POINTS.
+    """
+    layer = folium.FeatureGroup(name='Plantations')
+    if choropleth is not None:
+        add_choropleth(layer, choropleth)
+    if not _has_view(view) or view['zoom'] < STATE_ZOOM:
+        add_markers(layer, map_columns(state_data), map_type)
+        return tile_server.localize_assets(layer), 'states', None
+
+    extent = padded_bounds(view['bounds'])
+    visible = points.iloc[index.query(*extent)]
+    if len(visible) > MAX_VIEWPORT_POINTS:
+        visible, level = roll_up(visible, extent), 'cells'
+    else:
+        level = 'points'
+    add_markers(layer, map_columns(visible), map_type, labels=False)
+    return tile_server.localize_assets(layer), level, extent
+
+
+def covers(extent, view):
+    # True when a layer built for extent still holds everything in view
+    if extent is None or not _has_view(view):
+        return False
+    south, west, north, east = padded_bounds(view['bounds'], margin=0)
+    return extent[0] <= south and extent[1] <= west and extent[2] >= north and extent[3] >= east
+
+
+def can_reuse(last, view, map_type):
+    """Whether the layer from the previous rerun still fits the current view."""
+    if not last or last['map_type'] != map_type:
+        return False
+    if last['level'] == 'states':
+        return not _has_view(view) or view['zoom'] < STATE_ZOOM
+    return _has_view(view) and view['zoom'] == last['zoom'] and covers(last['extent'], view)
+
+
+def add_legend(m, map_type):
+    # Add legend based on map type
+    if map_type == "Ownership Structure":
+        legend_html = '''
+        <div style="position: fixed; bottom: 50px; left: 50px; width: 180px; height: 110px; 
+                    background-color: white; border: 2px solid grey; z-index: 9999; 
+                    font-size: 12px; font-family: Times New Roman; padding: 10px;">
+        <h5 style="margin: 0 0 10px 0;">Ownership Structure</h5>
+        <p style="margin: 2px;"><span style="color: #2E4057;">●</span> Corporate Estates</p>
+        <p style="margin: 2px;"><span style="color: #548CA8;">●</span> FELDA Schemes</p>
+        <p style="margin: 2px;"><span style="color: #334257;">●</span> Smallholders</p>
+        <p style="margin: 5px 0 0 0; font-size: 10px;">Circle size = Total plantation area</p>
+        </div>
+        '''
+    elif map_type == "FELDA Distribution":
+        legend_html = '''
+        <div style="position: fixed; bottom: 50px; left: 50px; width: 160px; height: 100px; 
+                    background-color: white; border: 2px solid grey; z-index: 9999; 
+                    font-size: 12px; font-family: Times New Roman; padding: 10px;">
+        <h5 style="margin: 0 0 10px 0;">FELDA Programs</h5>
+        <p style="margin: 2px;">🏛️ FELDA Schemes</p>
+        <p style="margin: 2px;">👨‍👩‍👧‍👦 Settler Families</p>
+        <p style="margin: 2px;">🏠 Community Infrastructure</p>
+        <p style="margin: 5px 0 0 0; font-size: 10px;">Click for detailed info</p>
+        </div>
+        '''
+    else:
+        legend_html = '''
+        <div style="position: fixed; bottom: 50px; left: 50px; width: 160px; height: 100px; 
+                    background-color: white; border: 2px solid grey; z-index: 9999; 
+                    font-size: 12px; font-family: Times New Roman; padding: 10px;">
+        <h5 style="margin: 0 0 10px 0;">Corporate Presence</h5>
+        <p style="margin: 2px;">🏢 Estate Areas</p>
+        <p style="margin: 2px;">🏭 Processing Facilities</p>
+        <p style="margin: 2px;">👷 Employment Impact</p>
+        <p style="margin: 5px 0 0 0; font-size: 10px;">Major plantation companies</p>
+        </div>
+        '''
+
+    m.get_root().html.add_child(folium.Element(legend_html))
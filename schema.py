@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Compact dtypes per table column, applied whenever a table is written to or
+# read from the store. Labels become categoricals (in order of appearance, so
+# charts keep their row order) and counts and hectares int32; an integer
+# column with missing values becomes the nullable Int32. A column is only
+# narrowed when its values fit, so a fractional or out-of-range ingest keeps
+# its wider dtype instead of being truncated.
+#
+# Measurements and coordinates stay float64: float32 would carry rounding
+# noise (5.670000076 for 5.67) into chart hovers, tables and the map HTML.
+# Free-text columns with a value per row are left as strings.
+CATEGORY = 'category'
+INT32 = 'int32'
+
+SCHEMAS = {
+    'ownership_data': {
+        'Year': INT32, 'European_Corporate': INT32, 'FELDA_Schemes': INT32,
+        'Independent_Smallholders': INT32, 'State_Schemes': INT32,
+    },
+    'crop_data': {
+        'Crop': CATEGORY, 'Smallholder_Percentage': INT32,
+    },
+    'state_data': {
+        'State': CATEGORY, 'Oil_Palm_Ha': INT32, 'Rubber_Ha': INT32, 'FELDA_Schemes': INT32,
+        'FELDA_Settlers': INT32, 'Corporate_Estates_Ha': INT32, 'Smallholder_Ha': INT32,
+    },
+    'export_data': {
+        'Year': INT32,
+    },
+    'felda_data': {
+        'Year': INT32, 'Schemes_Opened': INT32, 'Settlers_Families': INT32,
+        'Land_Developed_Ha': INT32, 'Oil_Palm_Ha': INT32,
+    },
+    'env_funding_data': {
+        'Amount_Million_USD': INT32, 'Focus_Area': CATEGORY, 'Coverage': CATEGORY,
+    },
+    'plastic_policy_data': {
+        'Percentage': INT32, 'Status': CATEGORY,
+    },
+    'fire_data_2025': {
+        'Month': CATEGORY, 'Malaysia_Fires': INT32, 'Indonesia_Fires': INT32, 'Regional_Total': INT32,
+    },
+    'ngo_achievements': {
+        'Year': INT32, 'Impact_Score': INT32,
+    },
+    'estate_points': {
+        'State': CATEGORY, 'Oil_Palm_Ha': INT32, 'Rubber_Ha': INT32, 'FELDA_Schemes': INT32,
+        'FELDA_Settlers': INT32, 'Corporate_Estates_Ha': INT32, 'Smallholder_Ha': INT32,
+    },
+}
+
+_INT32_MIN, _INT32_MAX = np.iinfo('int32').min, np.iinfo('int32').max
+
+
+def _compact(column, dtype):
+    if dtype == CATEGORY:
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            return column
+        return pd.Series(pd.Categorical(column, categories=pd.unique(column.dropna())), index=column.index, name=column.name)
+
+    if not pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column):
+        return column
+    if dtype == INT32:
+        if column.dtype in ('int32', 'Int32'):
+            return column
+        values = column.to_numpy(dtype='float64', na_value=np.nan)
+        present = values[~np.isnan(values)]
+        if (present != np.round(present)).any() or (present < _INT32_MIN).any() or (present > _INT32_MAX).any():
+            return column
+        return column.astype('Int32' if len(present) < len(values) else 'int32')
+    return column
+
+
+def apply(name, df):
+    """df with the compact dtypes of table name; unknown tables pass through."""
+    columns = SCHEMAS.get(name)
+    if df is None or not columns:
+        return df
+    changed = {}
+    for column, dtype in columns.items():
+        if column in df:
+            compact = _compact(df[column], dtype)
+            if compact is not df[column]:
+                changed[column] = compact
+    return df.assign(**changed) if changed else df
+
+
+def apply_arrow(name, table):
+    """The same narrowing on an Arrow table, for the Arrow-backed frames.
+
+    Categories become plain Arrow strings there: they already avoid the
+    per-value Python objects, and ArrowDtype supports few operations on
+    dictionary arrays. Columns that are already compact are not copied.
+    """
+    columns = SCHEMAS.get(name)
+    if table is None or not columns:
+        return table
+    for column, dtype in columns.items():
+        if column not in table.column_names:
+            continue
+        index = table.column_names.index(column)
+        values = table.column(index)
+        if pa.types.is_dictionary(values.type):
+            values = values.cast(values.type.value_type)
+        elif dtype == INT32 and values.type != pa.int32() and (pa.types.is_integer(values.type) or pa.types.is_floating(values.type)):
+            try:
+                # Only values that convert exactly
+                values = pc.cast(values, pa.int32(), safe=True)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                continue
+        else:
+            continue
+        table = table.set_column(index, column, values)
+    return table
+
+
+def widen(df):
+    # The table with pandas' default dtypes, to compare memory against
+    return df.assign(**{
+        column: df[column].astype(
+            str if isinstance(df[column].dtype, pd.CategoricalDtype)
+            else 'float64' if pd.api.types.is_float_dtype(df[column])
+            else 'int64' if pd.api.types.is_integer_dtype(df[column]) and not df[column].hasnans
+            else 'float64' if pd.api.types.is_integer_dtype(df[column])
+            else df[column].dtype
+        )
+        for column in df.columns
+    })
+
+
+def memory(df):
+    return int(df.memory_usage(deep=True).sum())
@@ -0,0 +1,42 @@
+import importlib
+
+# Dashboard sections in sidebar order: label -> module in this package. Each
+# module has a render(max_points) function that draws the section body.
+#
+# A section module is only imported the first time its section is opened, so
+# Folium and plotly.express stay out of the cold start until a section needs
+# them; the map section alone pulls in Folium. plotly.graph_objects is not
+# deferred: importing streamlit already loads it.
+SECTIONS = {
+    "Overview": 'overview',
+    "FELDA Vision & History": 'felda',
+    "Interactive Plantation Map": 'plantation',
+    "Trade Analysis": 'trade',
+    "Historical Timeline": 'timeline',
+    "Economic Analysis": 'economic',
+    "Environmental Analysis": 'environment',
+    "Insights": 'insights',
+}
+
+# Selectors inside a section that switch between views, for tools that go
+# through every view (bench.py, snapshot.py): label -> (widget label, name of
+# the module's option list)
+VARIANTS = {
+    "Interactive Plantation Map": ("Select Map View:", 'MAP_TYPES'),
+    "Environmental Analysis": ("Select Environmental Topic:", 'TOPICS'),
+}
+
+
+def load(label):
+    return importlib.import_module(f'{__name__}.{SECTIONS[label]}')
+
+
+def views():
+    """(name, section, widget label, option) for every view of every section."""
+    for section in SECTIONS:
+        if section not in VARIANTS:
+            yield section, section, None, None
+            continue
+        label, options = VARIANTS[section]
+        for option in getattr(load(section), options):
+            yield f'{section} / {option}', section, label, option
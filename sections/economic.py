@@ -0,0 +1,67 @@
+import streamlit as st
+
+import charts
+import datasets
+import figure_cache
+import timings
+
+
+def render(max_points):
+    export_data = datasets.get('export_data')
+    crop_data = datasets.get('crop_data')
+    
+    st.subheader("Economic Impact Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig_export = figure_cache.figure('fig_export', ['export_data'], lambda max_points: charts.fig_export(export_data, max_points), max_points=max_points)
+        timings.plotly_chart(fig_export, use_container_width=True)
+    
+    with col2:
+        fig_smallholder = figure_cache.figure('fig_smallholder', ['crop_data'], lambda: charts.fig_smallholder(crop_data))
+        timings.plotly_chart(fig_smallholder, use_container_width=True)
+    
+    # Economic indicators
+    st.markdown("### Key Economic Indicators (2024)")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="insight-box">
+            <h4 style="color: #2E4057;">GDP Contribution</h4>
+            <ul style="margin: 0;">
+                <li>Agriculture: 5.3% of total GDP</li>
+                <li>Palm oil: 2.0% of GDP</li>
+                <li>Export share: 12.2% of total exports</li>
+                <li>Total export value: $32.5B</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="insight-box">
+            <h4 style="color: #2E4057;">Employment Impact</h4>
+            <ul style="margin: 0;">
+                <li>Agricultural workforce: ~10% of total</li>
+                <li>FELDA settler families: 123,000</li>
+                <li>Smallholder families: >1.2 million</li>
+                <li>Plantation workers: ~650,000</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="insight-box">
+            <h4 style="color: #2E4057;">Global Position</h4>
+            <ul style="margin: 0;">
+                <li>2nd largest palm oil producer</li>
+                <li>Largest palm oil exporter</li>
+                <li>26% of world palm oil production</li>
+                <li>34% of world palm oil exports</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
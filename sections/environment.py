@@ -0,0 +1,441 @@
+import streamlit as st
+import pandas as pd
+
+import charts
+import datasets
+import figure_cache
+import timings
+
+TOPICS = ["Funding Mechanisms", "Policy Reactions & Lynas Case", "Environmental Activism", "Current Forest Fire Crisis"]
+
+
+def render(max_points):
+    st.markdown("""
+    <div class="felda-card">
+        <h2 style="color: #2E4057; text-align: center;">🌍 Environmental Protection & Sustainability Analysis</h2>
+        <p style="text-align: center; font-size: 1.1rem; margin: 0;">Southeast Asia Environmental Funding, Policy Reactions & Forest Fire Crisis</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Environmental metrics overview
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #2E4057; margin: 0;">$3.1T</h3>
+            <p style="margin: 0; color: #6c757d;">SEA Climate Investment Needed by 2030</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #2E4057; margin: 0;">$1.8B</h3>
+            <p style="margin: 0; color: #6c757d;">ACGF Committed Funding</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #2E4057; margin: 0;">30%</h3>
+            <p style="margin: 0; color: #6c757d;">Plastic Bag Usage Reduction</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #2E4057; margin: 0;">245</h3>
+            <p style="margin: 0; color: #6c757d;">Active Fires (July 2025)</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Only the topic panel reruns when another topic is picked
+    @timings.fragment('env_topic')
+    def env_topic_panel():
+        # Sub-navigation for environmental topics
+        st.markdown("---")
+        env_topic = st.selectbox(
+            "Select Environmental Topic:",
+            TOPICS
+        )
+        
+        if env_topic == "Funding Mechanisms":
+            env_funding_data = datasets.get('env_funding_data')
+            
+            st.subheader("💰 Southeast Asia Environmental Funding Landscape")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                fig_funding = figure_cache.figure('fig_funding', ['env_funding_data'], lambda: charts.fig_funding(env_funding_data))
+                timings.plotly_chart(fig_funding, use_container_width=True)
+            
+            with col2:
+                fig_gap = figure_cache.figure('fig_gap', [], charts.fig_gap)
+                timings.plotly_chart(fig_gap, use_container_width=True)
+            
+            # Funding details
+            st.subheader("📋 Key Funding Mechanisms Details")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("""
+                <div class="env-card">
+                    <h4 style="color: #2E4057;">🏛️ ASEAN Catalytic Green Finance Facility (ACGF)</h4>
+                    <ul>
+                        <li><strong>Established:</strong> April 2019</li>
+                        <li><strong>Funding:</strong> $1.8B committed by 9 partners</li>
+                        <li><strong>Target:</strong> 20+ high-impact projects</li>
+                        <li><strong>Expected Impact:</strong> 119M tons CO2 reduction over 30 years</li>
+                        <li><strong>Job Creation:</strong> 340,000 green jobs</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                st.markdown("""
+                <div class="env-card">
+                    <h4 style="color: #2E4057;">🌍 Green Climate Fund Programs</h4>
+                    <ul>
+                        <li><strong>SEA Allocation:</strong> $300M for green recovery</li>
+                        <li><strong>Priority Countries:</strong> Cambodia, Indonesia, Laos, Philippines</li>
+                        <li><strong>Focus:</strong> Sustainable transport, renewable energy</li>
+                        <li><strong>Leverage:</strong> $4+ billion in infrastructure projects</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown("""
+                <div class="env-card">
+                    <h4 style="color: #2E4057;">🇨🇳 China-ASEAN Environmental Cooperation</h4>
+                    <ul>
+                        <li><strong>Investment Fund:</strong> Up to $10B for infrastructure</li>
+                        <li><strong>Strategy Period:</strong> 2021-2025</li>
+                        <li><strong>Focus Areas:</strong> Ocean plastics, air quality, biodiversity</li>
+                        <li><strong>Framework:</strong> ASEAN+3 coalition cooperation</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                st.markdown("""
+                <div class="env-card">
+                    <h4 style="color: #2E4057;">🇦🇺 Australia & Others</h4>
+                    <ul>
+                        <li><strong>Australia:</strong> AUD 75M Green Investment Partnership</li>
+                        <li><strong>South Korea:</strong> $45M ASEAN-Korea Cooperation Fund</li>
+                        <li><strong>Singapore:</strong> $6B+ green bond market</li>
+                        <li><strong>Japan:</strong> Funding for peat fire solutions (NET-PEAT)</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        elif env_topic == "Policy Reactions & Lynas Case":
+            plastic_policy_data = datasets.get('plastic_policy_data')
+            
+            st.subheader("🏛️ Environmental Policy Reactions & Major Case Studies")
+            
+            # Plastic policy success metrics
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                fig_plastic = figure_cache.figure('fig_plastic', ['plastic_policy_data'], lambda: charts.fig_plastic(plastic_policy_data))
+                timings.plotly_chart(fig_plastic, use_container_width=True)
+            
+            with col2:
+                st.markdown("""
+                <div class="success-box">
+                    <h4 style="color: #2E4057;">✅ Plastic Policy Achievements</h4>
+                    <ul>
+                        <li><strong>Usage Reduction:</strong> 30% decrease in plastic bag usage</li>
+                        <li><strong>Community Engagement:</strong> 40% increase in voluntary clean-ups</li>
+                        <li><strong>Awareness:</strong> 50% improvement in public understanding</li>
+                        <li><strong>Penang Success:</strong> 2x national recycling average</li>
+                    </ul>
+                    <p style="margin-top: 10px; font-size: 0.9em;"><em>Source: Research study of 262 households in Johor, 2024</em></p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Lynas Case Study
+            st.subheader("⚠️ Lynas Rare Earth Controversy: Complete Case Study")
+            
+            # Timeline
+            lynas_timeline = pd.DataFrame({
+                'Year': [2008, 2012, 2018, 2020, 2023],
+                'Event': ['Concerns Raised in Parliament', 'Plant Operations Begin', 'Government Review Ordered', 'Waste Conditions Set', 'Operations Restricted'],
+                'Impact': ['High Opposition', 'Public Protests', 'Policy Change', 'Regulation', 'Partial Victory'],
+                'Stakeholder': ['MP Fuziah Salleh', 'Lynas Corporation', 'New Government', 'Minister Chang', 'Environmental Groups']
+            })
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("""
+                <div class="timeline-item">
+                    <h4 style="color: #2E4057;">📍 Causes & Background</h4>
+                    <ul>
+                        <li><strong>Company:</strong> Lynas Corporation (Australian)</li>
+                        <li><strong>Investment:</strong> A$1 billion processing plant in Kuantan, Pahang</li>
+                        <li><strong>Historical Context:</strong> Previous Mitsubishi facility in Bukit Merah linked to birth defects, cost $99.2M cleanup</li>
+                        <li><strong>Waste Production:</strong> 1+ million metric tons radioactive waste by 2023</li>
+                    </ul>
+                </div>
+                
+                <div class="timeline-item">
+                    <h4 style="color: #2E4057;">⚡ Public Response & Actions</h4>
+                    <ul>
+                        <li><strong>Parliamentary Action:</strong> MP Fuziah Salleh raised concerns since 2008</li>
+                        <li><strong>Community Groups:</strong> "Concerned Citizens of Kuantan" formed 2008</li>
+                        <li><strong>Legal Challenges:</strong> Court cases filed by residents</li>
+                        <li><strong>Protests:</strong> Widespread demonstrations from local to national level</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown("""
+                <div class="timeline-item">
+                    <h4 style="color: #2E4057;">🏛️ Government Response & Results</h4>
+                    <ul>
+                        <li><strong>2018:</strong> New government ordered comprehensive review</li>
+                        <li><strong>2020:</strong> Conditions set requiring waste operations to stop by 2023</li>
+                        <li><strong>2023:</strong> Denied request to continue radioactive waste production</li>
+                        <li><strong>Current:</strong> Plant continues operations without waste generation</li>
+                    </ul>
+                </div>
+                
+                <div class="alert-box">
+                    <h4 style="color: #856404;">💼 Current Status</h4>
+                    <p><strong>Government Stance:</strong> "No party has right to continuously produce radioactive waste in our homeland" - Minister Chang Lih Kang</p>
+                    <p><strong>Employment:</strong> 600 Malaysian workers still employed</p>
+                    <p><strong>Operations:</strong> Continues without radioactive waste production</p>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        elif env_topic == "Environmental Activism":
+            ngo_achievements = datasets.get('ngo_achievements')
+            
+            st.subheader("🌱 Environmental Activism in Malaysia & Southeast Asia")
+            
+            # NGO Achievement Overview
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                fig_ngo = figure_cache.figure('fig_ngo', ['ngo_achievements'], lambda: charts.fig_ngo(ngo_achievements))
+                timings.plotly_chart(fig_ngo, use_container_width=True)
+            
+            with col2:
+                fig_timeline = figure_cache.figure('fig_timeline', ['ngo_achievements'], lambda: charts.fig_timeline(ngo_achievements))
+                timings.plotly_chart(fig_timeline, use_container_width=True)
+            
+            # Detailed NGO Achievements
+            st.subheader("🏆 Major Environmental Victories")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("""
+                <div class="success-box">
+                    <h4 style="color: #2E4057;">🌊 Greenpeace Southeast Asia (2000-2025)</h4>
+                    <ul>
+                        <li><strong>Krabi Coal Plant:</strong> Successfully stopped Thailand coal-fired power plant (2021)</li>
+                        <li><strong>GMO Victory:</strong> Philippines Court banned commercial GMO crops (2024)</li>
+                        <li><strong>Palm Oil Campaign:</strong> Forced Nestlé to stop buying from forest destroyers</li>
+                        <li><strong>Regional Presence:</strong> 25 years of operations across SEA</li>
+                    </ul>
+                    <p style="font-size: 0.9em; margin-top: 10px;"><em>Malaysia office established July 28, 2017</em></p>
+                </div>
+                
+                <div class="success-box">
+                    <h4 style="color: #2E4057;">🏛️ Sahabat Alam Malaysia - SAM (1977-Present)</h4>
+                    <ul>
+                        <li><strong>International Recognition:</strong> Right Livelihood Award (1988), Goldman Award (1991)</li>
+                        <li><strong>Forest Protection:</strong> Highlighted Sarawak rainforest destruction</li>
+                        <li><strong>Community Support:</strong> Assisted Bukit Koman against cyanide mining</li>
+                        <li><strong>Indigenous Rights:</strong> Fighting landgrabbing across 3M+ hectares</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown("""
+                <div class="success-box">
+                    <h4 style="color: #2E4057;">🐯 WWF Malaysia (1972-Present)</h4>
+                    <ul>
+                        <li><strong>Forest Restoration:</strong> 2,400 hectares restored at Bukit Piton (10+ years)</li>
+                        <li><strong>Tiger Conservation:</strong> National Tiger Survey showing critical status</li>
+                        <li><strong>Orangutan Protection:</strong> Secured riparian reserves along Kinabatangan River</li>
+                        <li><strong>Community Programs:</strong> Sustainable income for Menyang Taih communities</li>
+                    </ul>
+                </div>
+                
+                <div class="success-box">
+                    <h4 style="color: #2E4057;">♻️ Grassroots Environmental Heroes</h4>
+                    <ul>
+                        <li><strong>Lay Peng Pua:</strong> Closed 300+ illegal plastic waste facilities in Kuala Langat</li>
+                        <li><strong>Lost Food Project:</strong> Prevented 6.78M kg greenhouse gas emissions</li>
+                        <li><strong>EcoKnights:</strong> Created awareness through environmental films (KLEFF)</li>
+                        <li><strong>CETDEM:</strong> Founded by Gurmit Singh, halted Tembeling Dam</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Government and Public Perception
+            st.subheader("📊 Government & Public Perception of Environmental Activism")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.markdown("""
+                <div class="insight-box">
+                    <h4 style="color: #2E4057;">🏛️ Government Response</h4>
+                    <ul>
+                        <li>Human Rights Commission recognized environmental rights as basic human rights</li>
+                        <li>Six recommendations including Clean Air Act enactment</li>
+                        <li>More receptive to environmental organizations post-2018 election</li>
+                        <li>Malaysia voting for UN resolution declaring clean environment as universal right</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown("""
+                <div class="insight-box">
+                    <h4 style="color: #2E4057;">👥 Public Perception</h4>
+                    <ul>
+                        <li>Growing public criticism despite media controls</li>
+                        <li>Social media campaigns demanding stricter enforcement</li>
+                        <li>Environmental groups filing human rights complaints</li>
+                        <li>Increasing awareness of health impacts driving policy pressure</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col3:
+                st.markdown("""
+                <div class="insight-box">
+                    <h4 style="color: #2E4057;">🎯 Achievements Impact</h4>
+                    <ul>
+                        <li><strong>Policy Changes:</strong> Multiple government reviews and restrictions</li>
+                        <li><strong>Corporate Accountability:</strong> 300,000-signature petitions delivered</li>
+                        <li><strong>International Recognition:</strong> Multiple global awards</li>
+                        <li><strong>Legal Precedents:</strong> Court victories and regulatory changes</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        elif env_topic == "Current Forest Fire Crisis":
+            fire_data_2025 = datasets.get('fire_data_2025')
+            
+            st.subheader("🔥 Current Forest Fire Situation & Climate Change Impact")
+            
+            # Current fire situation
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                fig_fires = figure_cache.figure('fig_fires', ['fire_data_2025'], lambda max_points: charts.fig_fires(fire_data_2025, max_points), max_points=max_points)
+                timings.plotly_chart(fig_fires, use_container_width=True)
+            
+            with col2:
+                fig_impact = figure_cache.figure('fig_impact', [], charts.fig_impact)
+                timings.plotly_chart(fig_impact, use_container_width=True)
+            
+            # Current crisis details
+            st.subheader("🚨 August 2025 Crisis Update")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("""
+                <div class="alert-box">
+                    <h4 style="color: #856404;">🔥 Active Fire Situation</h4>
+                    <ul>
+                        <li><strong>Indonesia:</strong> 140+ fires in Riau province</li>
+                        <li><strong>Malaysia:</strong> Haze detected in Negeri Sembilan</li>
+                        <li><strong>Sarawak:</strong> 100+ hectares burned near UiTM Mukah</li>
+                        <li><strong>Visibility:</strong> Reduced to 1km in worst-hit areas</li>
+                        <li><strong>Air Quality:</strong> API readings mostly moderate with unhealthy spikes</li>
+                    </ul>
+                </div>
+                
+                <div class="env-card">
+                    <h4 style="color: #2E4057;">🌡️ Climate Change Connection</h4>
+                    <ul>
+                        <li><strong>El Niño Return:</strong> Hotter, drier conditions since 2023</li>
+                        <li><strong>Record Heat:</strong> 2024 was hottest year on record</li>
+                        <li><strong>Fire Risk:</strong> Climate change made fires twice as likely</li>
+                        <li><strong>Rainfall Patterns:</strong> Increasingly erratic, intensifying dry spells</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown("""
+                <div class="success-box">
+                    <h4 style="color: #2E4057;">🌿 NGO Actions & Response</h4>
+                    <ul>
+                        <li><strong>Greenpeace:</strong> Fire Prevention Team mapping/monitoring hotspots</li>
+                        <li><strong>Legal Action:</strong> Palembang Court battles for haze accountability</li>
+                        <li><strong>Community Work:</strong> Collaboration with affected areas for early detection</li>
+                        <li><strong>Research:</strong> University partnerships on peat fire solutions</li>
+                    </ul>
+                </div>
+                
+                <div class="env-card">
+                    <h4 style="color: #2E4057;">🏛️ Government Actions</h4>
+                    <ul>
+                        <li><strong>Arrests:</strong> 44 people detained for suspected fire-setting in Indonesia</li>
+                        <li><strong>Enhanced Patrols:</strong> Sarawak authorities enforcing open burning bans</li>
+                        <li><strong>Cloud-Seeding:</strong> Operations considered for worst-affected areas</li>
+                        <li><strong>Regional Cooperation:</strong> Minister calls for stronger ASEAN action</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Malaysia's positive progress
+            st.subheader("📈 Malaysia's Environmental Progress")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.markdown("""
+                <div class="success-box">
+                    <h4 style="color: #2E4057;">🌳 Forest Conservation</h4>
+                    <ul>
+                        <li><strong>Deforestation Decline:</strong> 13% reduction in primary forest loss</li>
+                        <li><strong>Global Ranking:</strong> Out of top 10 deforestation countries for first time</li>
+                        <li><strong>Forest Cover:</strong> Maintaining 50% forest coverage commitment</li>
+                        <li><strong>Carbon Sequestration:</strong> Forests absorb 3/4 of CO2 emissions</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown("""
+                <div class="success-box">
+                    <h4 style="color: #2E4057;">⚡ Climate Policy</h4>
+                    <ul>
+                        <li><strong>Net Zero Target:</strong> Committed to net-zero emissions by 2050</li>
+                        <li><strong>NETR:</strong> National Energy Transition Roadmap launched July 2023</li>
+                        <li><strong>Investment:</strong> RM 16B for grid upgrade and decarbonization</li>
+                        <li><strong>Green Finance:</strong> RM 200B in low-carbon economy financing</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col3:
+                st.markdown("""
+                <div class="success-box">
+                    <h4 style="color: #2E4057;">👥 Community Impact</h4>
+                    <ul>
+                        <li><strong>Wildlife Recovery:</strong> Orangutan habitat restoration projects</li>
+                        <li><strong>Tiger Conservation:</strong> <150 Malayan tigers, intensive protection programs</li>
+                        <li><strong>Waste Management:</strong> 300+ illegal facilities closed in Kuala Langat</li>
+                        <li><strong>Education:</strong> Environmental film festivals reaching 80,000+ Malaysians</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+    env_topic_panel()
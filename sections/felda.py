@@ -0,0 +1,122 @@
+import streamlit as st
+
+import charts
+import datasets
+import figure_cache
+import timings
+
+
+def render(max_points):
+    felda_data = datasets.get('felda_data')
+    
+    st.markdown("""
+    <div class="felda-card">
+        <h2 style="color: #2E4057; text-align: center;">🏛️ FELDA: Transforming Rural Malaysia Since 1956</h2>
+        <p style="text-align: center; font-size: 1.1rem; margin: 0;">Federal Land Development Authority - A Vision of Rural Prosperity</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # FELDA Vision and Mission
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        #### 🎯 FELDA Vision
+        **"To be a world-class organization in sustainable plantation development and agribusiness."**
+        
+        #### 📋 Original Mission (1956)
+        - **Poverty Eradication**: Provide land to landless rural poor
+        - **National Unity**: Integrate different ethnic communities
+        - **Economic Development**: Develop plantation agriculture
+        - **Rural Transformation**: Create modern rural communities
+        """)
+    
+    with col2:
+        st.markdown("""
+        #### 🏗️ FELDA Model Components
+        - **Land Allocation**: 4 hectares per settler family
+        - **Infrastructure**: Houses, schools, clinics, mosques
+        - **Technical Support**: Agricultural extension services
+        - **Financial Aid**: Loans and subsidies during establishment
+        - **Community Development**: Cooperative societies and associations
+        """)
+    
+    # FELDA Growth Timeline
+    st.subheader("📈 FELDA Development Timeline (1956-2024)")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig_schemes = figure_cache.figure('fig_schemes', ['felda_data'], lambda max_points: charts.fig_schemes(felda_data, max_points), max_points=max_points)
+        timings.plotly_chart(fig_schemes, use_container_width=True)
+    
+    with col2:
+        fig_settlers = figure_cache.figure('fig_settlers', ['felda_data'], lambda max_points: charts.fig_settlers(felda_data, max_points), max_points=max_points)
+        timings.plotly_chart(fig_settlers, use_container_width=True)
+    
+    # FELDA Corporate Evolution
+    st.subheader("🏢 FELDA Corporate Structure Evolution")
+    
+    st.markdown("""
+    <div class="timeline-item">
+        <h4 style="color: #2E4057;">1956-1980: Government Agency Era</h4>
+        <p>FELDA operated as a government development agency focusing purely on land settlement and smallholder development.</p>
+    </div>
+    
+    <div class="timeline-item">
+        <h4 style="color: #2E4057;">1980-2000: Commercialization Phase</h4>
+        <p>Established FELDA Holdings to manage commercial plantations and processing facilities. Began vertical integration into palm oil milling and refining.</p>
+    </div>
+    
+    <div class="timeline-item">
+        <h4 style="color: #2E4057;">2000-2012: Corporate Expansion</h4>
+        <p>Created multiple subsidiaries including FELDA Global Ventures (FGV), expanded into downstream industries, and developed global operations.</p>
+    </div>
+    
+    <div class="timeline-item">
+        <h4 style="color: #2E4057;">2012-Present: Public-Private Model</h4>
+        <p>FGV became publicly listed (2012), creating hybrid model where FELDA maintains development role while FGV operates commercial businesses.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Current FELDA Structure
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="insight-box">
+            <h4 style="color: #2E4057;">👥 FELDA (Development)</h4>
+            <ul>
+                <li>Land development authority</li>
+                <li>Settler welfare & support</li>
+                <li>Community development</li>
+                <li>Social infrastructure</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="insight-box">
+            <h4 style="color: #2E4057;">🏭 FGV Holdings (Commercial)</h4>
+            <ul>
+                <li>Plantation management</li>
+                <li>Palm oil processing</li>
+                <li>Global trading</li>
+                <li>Downstream products</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="insight-box">
+            <h4 style="color: #2E4057;">🤝 Settler Cooperatives</h4>
+            <ul>
+                <li>Individual land ownership</li>
+                <li>Cooperative societies</li>
+                <li>Profit sharing</li>
+                <li>Community participation</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
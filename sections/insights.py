@@ -0,0 +1,81 @@
+import streamlit as st
+
+
+def render(max_points):
+    st.subheader("Key Insights and Analysis")
+    
+    insights = [
+        {
+            'title': 'Colonial Legacy and Transformation',
+            'content': 'British colonial policies created lasting inequality in land ownership, with Europeans controlling 73% of plantation agriculture in the 1920s. However, Malaysia\'s post-independence policies, particularly FELDA, successfully transformed this structure. Today, smallholders control 45% of oil palm and 94% of rubber production, demonstrating remarkable rural transformation.'
+        },
+        {
+            'title': 'FELDA: World-Class Rural Development Model',
+            'content': 'FELDA represents one of the world\'s most successful rural development programs. From its establishment in 1956 to today\'s 317 schemes serving 123,000 families, FELDA has lifted entire communities out of poverty. The model combines land allocation (4 hectares per family), infrastructure development, and technical support, creating sustainable rural economies.'
+        },
+        {
+            'title': 'Trade Balance Success Story',
+            'content': 'Malaysia maintains a strong agricultural trade surplus of $20.1 billion, led by palm oil exports ($22.3B) and rubber ($3.2B). However, the country remains import-dependent for rice ($2.8B deficit), highlighting food security challenges despite agricultural success in cash crops.'
+        },
+        {
+            'title': 'Corporate-Smallholder Coexistence',
+            'content': 'Malaysia has achieved a unique balance between large-scale corporate efficiency and smallholder inclusivity. Major corporations like IOI, Sime Darby, and FGV operate alongside 1.2 million smallholder families, creating a diversified agricultural ecosystem that benefits from both economies of scale and grassroots participation.'
+        },
+        {
+            'title': 'Environmental Activism Effectiveness',
+            'content': 'Malaysian environmental NGOs have achieved significant victories including stopping major industrial projects (Lynas restrictions, Krabi coal plant), securing international recognition (Right Livelihood Award), and creating lasting policy changes. The Lynas controversy demonstrates how sustained public opposition can influence government decisions on environmental issues.'
+        },
+        {
+            'title': 'Climate Finance Challenge and Opportunity',
+            'content': 'Southeast Asia faces a $52 billion annual climate financing gap despite $1.8 billion in committed funding. Malaysia\'s 13% reduction in forest loss and exit from top 10 deforestation countries shows progress, but current forest fires and haze episodes highlight ongoing regional challenges requiring enhanced cooperation.'
+        },
+        {
+            'title': 'Sustainability Challenge and Innovation',
+            'content': 'With palm oil expansion capped at 6.5 million hectares and 50% forest cover maintained, Malaysia must focus on productivity improvements rather than area expansion. This constraint drives innovation in sustainable practices, precision agriculture, and value-added processing to maintain competitiveness.'
+        },
+        {
+            'title': 'FELDA Corporate Evolution Impact',
+            'content': 'FELDA\'s transformation from government agency to hybrid public-private model (with FGV Holdings) demonstrates institutional evolution. While this brought commercial efficiency and global reach, it also created tensions between development objectives and profit maximization, requiring careful balance to maintain settler welfare.'
+        }
+    ]
+    
+    for insight in insights:
+        st.markdown(f"""
+        <div class="insight-box">
+            <h4 style="color: #2E4057; margin-bottom: 10px;">{insight['title']}</h4>
+            <p style="line-height: 1.6; margin: 0;">{insight['content']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Future outlook
+    st.subheader("Future Outlook and Strategic Recommendations")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        #### 🌟 Strategic Opportunities
+        - **Productivity Enhancement**: Focus on yield improvements through R&D and precision agriculture
+        - **Value-Added Processing**: Develop downstream industries and specialty products
+        - **Sustainable Certification**: Meet international sustainability standards (RSPO, MSPO)
+        - **Digital Agriculture**: Adopt IoT, AI, and precision farming technologies
+        - **Crop Diversification**: Expand high-value crops like durian and specialty fruits
+        - **FELDA 2.0**: Modernize FELDA schemes with young farmers and new technologies
+        - **Green Finance**: Leverage $1.8B ACGF funding for sustainable agriculture projects
+        - **Climate Adaptation**: Develop drought-resistant varieties and water management systems
+        """)
+    
+    with col2:
+        st.markdown("""
+        #### ⚠️ Strategic Challenges
+        - **Land Scarcity**: Limited expansion opportunities require intensive productivity focus
+        - **Environmental Pressure**: EU deforestation regulations and certification requirements
+        - **Aging Workforce**: Second-generation FELDA settlers and smallholder succession issues
+        - **Climate Change**: Weather variability affects yields and long-term sustainability
+        - **Market Access**: Trade restrictions and changing global palm oil demand patterns
+        - **Food Security**: Rice import dependency requires domestic production enhancement
+        - **Forest Fire Risk**: Continued haze episodes affecting regional air quality and health
+        - **Financing Gap**: $52B annual shortfall in climate finance needs regional solutions
+        """)
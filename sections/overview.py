@@ -0,0 +1,60 @@
+import streamlit as st
+
+import charts
+import datasets
+import figure_cache
+import timings
+
+
+def render(max_points):
+    crop_data = datasets.get('crop_data')
+    
+    # Key Metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #2E4057; margin: 0;">5.67M</h3>
+            <p style="margin: 0; color: #6c757d;">Hectares Oil Palm (2024)</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #2E4057; margin: 0;">$22.3B</h3>
+            <p style="margin: 0; color: #6c757d;">Palm Oil Export Value</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #2E4057; margin: 0;">317</h3>
+            <p style="margin: 0; color: #6c757d;">FELDA Schemes Active</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #2E4057; margin: 0;">123K</h3>
+            <p style="margin: 0; color: #6c757d;">FELDA Settler Families</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Current crop distribution
+    st.subheader("Current Agricultural Land Distribution (2024)")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig_pie = figure_cache.figure('fig_pie', ['crop_data'], lambda: charts.fig_pie(crop_data))
+        timings.plotly_chart(fig_pie, use_container_width=True)
+    
+    with col2:
+        fig_trade = figure_cache.figure('fig_trade', ['crop_data'], lambda: charts.fig_trade(crop_data))
+        timings.plotly_chart(fig_trade, use_container_width=True)
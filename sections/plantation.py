@@ -0,0 +1,135 @@
+import copy
+
+import streamlit as st
+from streamlit_folium import st_folium
+
+import boundaries
+import datasets
+import figure_cache
+import plantation_map
+from spatial_index import GridIndex
+import timings
+
+MAP_TYPES = ["Ownership Structure", "FELDA Distribution", "Corporate Presence"]
+
+
+def render(max_points):
+    state_data = datasets.get('state_data')
+    
+    st.subheader("🗺️ Interactive Malaysian Plantation Map")
+    st.markdown("**Click on states to see detailed breakdown of corporate estates, FELDA schemes, and smallholders**")
+    
+    # The map and its view selector rerun on their own, so switching views
+    # or panning only redraws this panel
+    @timings.fragment('map_type')
+    def map_panel():
+        # Map type selection
+        map_type = st.selectbox(
+            "Select Map View:",
+            MAP_TYPES
+        )
+        
+        # Estate and scheme points when they have been ingested, otherwise the
+        # state centroids; large point sets go into a single clustered layer,
+        # smaller ones are drawn as individual markers
+        points = datasets.get('estate_points')
+        layer = plantation_map.layer_for(points)
+        
+        # The Ownership Structure view is drawn as a choropleth once simplified
+        # state boundaries have been built (python boundaries.py), at the level
+        # of detail that suits the current zoom
+        view = st.session_state.get('plantation_map') or {}
+        zoom = plantation_map.view_zoom(view) if plantation_map.MAP_MODE == 'viewport' else plantation_map.ZOOM_START
+        choropleth, choropleth_key = None, None
+        if map_type == "Ownership Structure" and boundaries.available('states'):
+            choropleth_key = (boundaries.tolerance_for_zoom(zoom), boundaries.fingerprint('states'))
+            choropleth = figure_cache.figure(
+                'ownership_choropleth', ['state_data'],
+                lambda level: plantation_map.ownership_choropleth(state_data, boundaries.load('states', level[0])),
+                level=choropleth_key
+            )
+        
+        # The built map is cached per map_type, layer and dataset version
+        if plantation_map.MAP_MODE == 'viewport':
+            index = figure_cache.figure(
+                'estate_index', ['estate_points'],
+                lambda: GridIndex(points['Latitude'], points['Longitude'])
+            )
+            # st_folium attaches the feature group to the map it is given and
+            # re-renders it, so each call gets its own base map (without
+            # markers it is cheap to build, and its script is the same every
+            # time) and a copy of the layer kept for reuse
+            m = plantation_map.base_map(map_type, choropleth is not None)
+            
+            # Reuse the last culled layer while the view stays inside its margin
+            last = st.session_state.get('plantation_map_layer')
+            if plantation_map.can_reuse(last, view, map_type) and last['choropleth_key'] == choropleth_key:
+                markers_layer = last['layer']
+            else:
+                with timings.span('viewport layer', map_type):
+                    markers_layer, level, extent = plantation_map.viewport_layer(
+                        state_data, points, index, map_type, view, choropleth
+                    )
+                st.session_state['plantation_map_layer'] = {
+                    'map_type': map_type, 'level': level, 'zoom': view.get('zoom'), 'extent': extent,
+                    'choropleth_key': choropleth_key, 'layer': markers_layer
+                }
+            
+            with timings.span('st_folium', map_type):
+                st_folium(
+                    m, key='plantation_map', width=700, height=500,
+                    feature_group_to_add=copy.deepcopy(markers_layer), returned_objects=['bounds', 'zoom']
+                )
+        elif plantation_map.MAP_MODE == 'folium':
+            m = figure_cache.figure(
+                'plantation_map', ['estate_points'],
+                lambda map_type, layer, choropleth_key: plantation_map.build_map(points, map_type, layer, choropleth),
+                map_type=map_type, layer=layer, choropleth_key=choropleth_key
+            )
+            with timings.span('st_folium', map_type):
+                st_folium(m, width=700, height=500, returned_objects=[])
+        else:
+            map_html = figure_cache.figure(
+                'plantation_map_html', ['estate_points'],
+                lambda map_type, layer, choropleth_key: plantation_map.build_map(points, map_type, layer, choropleth).get_root().render(),
+                map_type=map_type, layer=layer, choropleth_key=choropleth_key
+            )
+            with timings.span('map html', map_type):
+                st.iframe(map_html, width=700, height=500)
+    map_panel()
+    
+    st.markdown("---")
+    
+    # Summary statistics
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        total_corporate = state_data['Corporate_Estates_Ha'].sum()
+        st.markdown(f"""
+        <div class="metric-card">
+            <h4 style="color: #2E4057; margin: 0;">🏢 Corporate Estates</h4>
+            <p style="margin: 5px 0;"><strong>{total_corporate:,}</strong> hectares</p>
+            <p style="margin: 0; font-size: 0.9em;">Major companies across {len(state_data)} states</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        total_felda_schemes = state_data['FELDA_Schemes'].sum()
+        total_settlers = state_data['FELDA_Settlers'].sum()
+        st.markdown(f"""
+        <div class="metric-card">
+            <h4 style="color: #548CA8; margin: 0;">🏛️ FELDA Programs</h4>
+            <p style="margin: 5px 0;"><strong>{total_felda_schemes}</strong> schemes</p>
+            <p style="margin: 0; font-size: 0.9em;"><strong>{total_settlers:,}</strong> settler families</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        total_smallholder = state_data['Smallholder_Ha'].sum()
+        st.markdown(f"""
+        <div class="metric-card">
+            <h4 style="color: #334257; margin: 0;">👨‍🌾 Smallholders</h4>
+            <p style="margin: 5px 0;"><strong>{total_smallholder:,}</strong> hectares</p>
+            <p style="margin: 0; font-size: 0.9em;">Independent farmers nationwide</p>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,55 @@
+import streamlit as st
+
+import charts
+import datasets
+import figure_cache
+import timings
+
+
+def render(max_points):
+    ownership_data = datasets.get('ownership_data')
+    
+    st.subheader("Historical Evolution of Malaysian Agriculture")
+    
+    timeline_data = [
+        {
+            'period': '1900s-1920s (Colonial Era)',
+            'description': 'British Plantation System: Large rubber estates dominated by European companies (73% ownership). Tin mining and rubber exports formed economic backbone. Malays restricted to rice cultivation through land reservation laws.'
+        },
+        {
+            'period': '1920s-1940s',
+            'description': 'Rubber Boom: Malaysia became world\'s largest rubber exporter. 1.1M acres of rubber by 1924 - 55% on European estates, 25% Malay smallholders. First commercial oil palm estate established in 1917.'
+        },
+        {
+            'period': '1956 - FELDA Establishment',
+            'description': 'Federal Land Development Authority created to eradicate rural poverty. Revolutionary approach: provide 4 hectares of land per family, complete with housing, infrastructure, and technical support. Beginning of Malaysia\'s most successful rural development program.'
+        },
+        {
+            'period': '1957-1960s (Independence)',
+            'description': 'Diversification Policy: Government reduced dependency on rubber and tin. FELDA schemes expanded rapidly - 12 schemes by 1960, growing to 78 by 1970. Each settler received comprehensive support package including loans, housing, and agricultural training.'
+        },
+        {
+            'period': '1980s-1990s',
+            'description': 'Palm Oil Expansion: Major plantation companies nationalized (Guthrie, Golden Hope, Sime Darby). FELDA reached 156 schemes by 1980 with 89,000 settler families. Palm oil plantations expanded rapidly as rubber prices declined.'
+        },
+        {
+            'period': '2000s-Present',
+            'description': 'Sustainable Agriculture: Malaysia caps palm oil at 6.5M hectares, maintaining 50% forest cover. FELDA operates 317 schemes with 123,000 families. Smallholders now cultivate 45% of oil palm, 94% of rubber, 96% of cocoa.'
+        }
+    ]
+    
+    for item in timeline_data:
+        st.markdown(f"""
+        <div class="timeline-item">
+            <h4 style="color: #2E4057; margin-bottom: 0.5rem;">{item['period']}</h4>
+            <p style="margin: 0; line-height: 1.6;">{item['description']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Land ownership evolution chart
+    st.subheader("📈 Land Ownership Evolution (1920-2024)")
+    
+    fig_ownership = figure_cache.figure('fig_ownership', ['ownership_data'], lambda max_points: charts.fig_ownership(ownership_data, max_points), max_points=max_points)
+    timings.plotly_chart(fig_ownership, use_container_width=True)
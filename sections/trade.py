@@ -0,0 +1,114 @@
+import html
+
+import streamlit as st
+
+import charts
+import datasets
+import figure_cache
+import tables
+import timings
+
+
+def render(max_points):
+    crop_data = datasets.get('crop_data')
+    export_data = datasets.get('export_data')
+    cube = datasets.get('trade_cube')
+    
+    st.subheader("📊 Import/Export Analysis by Crop")
+    
+    # The year and partner selectors rerun only the slice-dependent views
+    @timings.fragment('trade_filters')
+    def trade_panel():
+        # Every view below is a slice of the trade cube; the selectors only show
+        # up once ingested data has more than one year or partner
+        year = int(cube.years[-1])
+        if len(cube.years) > 1:
+            year = st.selectbox("Year:", cube.years[::-1].tolist())
+        partners = ()
+        if len(cube.partners) > 1:
+            partners = tuple(st.multiselect("Partner countries (all when empty):", cube.partners.tolist()))
+        trade = cube.commodity_table(year, partners)
+        
+        # Trade overview
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig_trade_compare = figure_cache.figure(
+                'fig_trade_compare', ['trade_cube'],
+                lambda year, partners: charts.fig_trade_compare(cube.commodity_table(year, partners), year),
+                year=year, partners=partners
+            )
+            timings.plotly_chart(fig_trade_compare, use_container_width=True)
+        
+        with col2:
+            fig_net_trade = figure_cache.figure(
+                'fig_net_trade', ['trade_cube'],
+                lambda year, partners: charts.fig_net_trade(cube.commodity_table(year, partners), year),
+                year=year, partners=partners
+            )
+            timings.plotly_chart(fig_net_trade, use_container_width=True)
+        
+        # Detailed trade data table
+        st.subheader(f"📋 Detailed Trade Data ({year})")
+        
+        trade_display = trade.merge(crop_data[['Crop', 'Production_Million_Tonnes']], on='Crop', how='left')
+        trade_display = trade_display[['Crop', 'Production_Million_Tonnes', 'Export_Value_Billion_USD', 
+                                       'Import_Value_Billion_USD', 'Net_Trade_Billion_USD']]
+        
+        trade_display.columns = ['Crop', 'Production (Million Tonnes)', 'Exports (Billion USD)', 
+                               'Imports (Billion USD)', 'Net Trade (Billion USD)']
+        
+        # Net trade cells are coloured a whole column at a time, and long tables
+        # are paged so only the visible rows are styled and sent
+        tables.paged_table(
+            trade_display, key='trade_table',
+            style=lambda rows: tables.style_balance(rows, ['Net Trade (Billion USD)'])
+        )
+        
+        # Trade insights
+        st.subheader("💡 Trade Analysis Insights")
+        
+        col1, col2 = st.columns(2)
+        
+        # Each panel is one markdown call over the top N crops, with the rest
+        # summed into a single line
+        with col1:
+            surplus_crops = trade[trade['Net_Trade_Billion_USD'] > 0]
+            top_surplus = tables.top_n(surplus_crops, 'Net_Trade_Billion_USD', tables.TOP_N)
+            items = "".join(
+                f"<li><strong>{html.escape(crop)}:</strong> +${net:.1f}B net export</li>"
+                for crop, net in zip(top_surplus['Crop'], top_surplus['Net_Trade_Billion_USD'])
+            )
+            if len(surplus_crops) > len(top_surplus):
+                rest = surplus_crops['Net_Trade_Billion_USD'].sum() - top_surplus['Net_Trade_Billion_USD'].sum()
+                items += f"<li><em>and {len(surplus_crops) - len(top_surplus):,} more:</em> +${rest:.1f}B net export</li>"
+            st.markdown(f"""
+            <div class="trade-box">
+                <h4 style="color: #155724;">✅ Export Champions (Trade Surplus)</h4>
+                <ul>{items}</ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            deficit_crops = trade[trade['Net_Trade_Billion_USD'] < 0]
+            top_deficit = tables.top_n(deficit_crops, 'Net_Trade_Billion_USD', tables.TOP_N, largest=False)
+            items = "".join(
+                f"<li><strong>{html.escape(crop)}:</strong> -${abs(net):.1f}B net import</li>"
+                for crop, net in zip(top_deficit['Crop'], top_deficit['Net_Trade_Billion_USD'])
+            )
+            if len(deficit_crops) > len(top_deficit):
+                rest = deficit_crops['Net_Trade_Billion_USD'].sum() - top_deficit['Net_Trade_Billion_USD'].sum()
+                items += f"<li><em>and {len(deficit_crops) - len(top_deficit):,} more:</em> -${abs(rest):.1f}B net import</li>"
+            st.markdown(f"""
+            <div style="background-color: #f8d7da; border: 1px solid #f5c6cb; border-radius: 8px; padding: 1rem; margin: 0.5rem 0; font-family: Times New Roman, serif;">
+                <h4 style="color: #721c24;">⚠️ Import Dependent (Trade Deficit)</h4>
+                <ul>{items}</ul>
+            </div>
+            """, unsafe_allow_html=True)
+    trade_panel()
+    
+    # Export trends over time
+    st.subheader("📈 Historical Export Value Trends")
+    
+    fig_export_trends = figure_cache.figure('fig_export_trends', ['export_data'], lambda max_points: charts.fig_export_trends(export_data, max_points), max_points=max_points)
+    timings.plotly_chart(fig_export_trends, use_container_width=True)
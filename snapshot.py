@@ -0,0 +1,296 @@
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import textwrap
+from datetime import datetime, timezone
+from pathlib import Path
+
+import plotly.offline
+from streamlit.testing.v1 import AppTest
+
+import page_style
+import sections
+import tile_server
+
+# Static export of the dashboard for read-only viewers. Every view of every
+# section is rendered headlessly through Streamlit's AppTest and its element
+# tree is written out as a plain HTML page: markdown and headings as HTML,
+# Plotly figures drawn by a shared plotly.min.js, the plantation map as a
+# standalone Folium page in an iframe, and tables with their cell styles.
+# Widgets are left out; each selector option gets its own page instead.
+#
+# The output directory can be served by any static file server:
+#   snapshot/index.html, <view>.html   one page per view
+#   snapshot/maps/<view>.html          Folium maps
+#   snapshot/assets/                   stylesheets, plotly.js and any Leaflet
+#                                      files from DASHBOARD_ASSET_DIR, all with
+#                                      content-hashed names
+SCRIPT = Path(__file__).parent / 'malaysia_dashboard.py'
+OUTPUT_DIR = Path(__file__).parent / 'snapshot'
+# Written into every output directory, so a later export only ever clears a
+# directory that an earlier one created
+MARKER = '.dashboard-snapshot'
+TITLE = "Malaysia Agricultural Land Use Dashboard"
+
+# Layout that Streamlit's own frontend provides in the live app
+LAYOUT_CSS = """
+body { margin: 0; display: flex; font-family: var(--dashboard-serif); color: #31333f; }
+nav { flex: 0 0 16rem; min-height: 100vh; padding: 1.5rem 1rem; background: #f0f2f6; box-sizing: border-box; }
+nav ul { list-style: none; padding-left: 0; }
+nav ul ul { padding-left: 1rem; font-size: 0.9em; }
+nav li { margin: 0.3rem 0; }
+nav a { color: #2E4057; text-decoration: none; }
+nav a.current { font-weight: bold; }
+main { flex: 1; min-width: 0; max-width: 80rem; padding: 2rem 3rem; }
+.row { display: flex; flex-wrap: wrap; gap: 1rem; }
+.row > .column { min-width: 0; }
+.chart { width: 100%; min-height: 450px; }
+.map { width: 100%; height: 520px; border: 0; }
+.caption { color: #6c757d; font-size: 0.875rem; }
+table.dataframe { border-collapse: collapse; font-size: 0.9rem; margin: 0.5rem 0; }
+table.dataframe th, table.dataframe td { border: 1px solid #dee2e6; padding: 0.3rem 0.6rem; text-align: right; }
+table.dataframe th { background: #f8f9fa; }
+details { border: 1px solid #dee2e6; border-radius: 8px; padding: 0.5rem 1rem; margin: 1rem 0; }
+summary { cursor: pointer; }
+"""
+
+HEADING = re.compile(r'^(#{1,6})\s+(.*)$')
+
+
+def slug(name):
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def _hashed_copy(data, name, assets_dir):
+    # name.<hash>.ext, so the files can be cached for good
+    stem, ext = name.rsplit('.', 1)
+    hashed = f'{stem}.{hashlib.blake2b(data, digest_size=6).hexdigest()}.{ext}'
+    (assets_dir / hashed).write_bytes(data)
+    return hashed
+
+
+def _inline(text):
+    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+    text = re.sub(r'(?<!\*)\*([^*]+)\*(?!\*)', r'<em>\1</em>', text)
+    return re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+
+
+def markdown_html(text):
+    """HTML for the markdown the dashboard writes: raw HTML blocks, headings,
+    rules, bullet lists and paragraphs with bold/italic/code."""
+    text = textwrap.dedent(text).strip()
+    if text.startswith('<'):
+        return text
+    out, paragraph, items = [], [], []
+
+    def flush():
+        if paragraph:
+            out.append(f"<p>{' '.join(paragraph)}</p>")
+            paragraph.clear()
+        if items:
+            out.append('<ul>' + ''.join(f'<li>{item}</li>' for item in items) + '</ul>')
+            items.clear()
+
+    for line in text.split('\n'):
+        line = line.strip()
+        heading = HEADING.match(line)
+        if not line:
+            flush()
+        elif line == '---':
+            flush()
+            out.append('<hr>')
+        elif heading:
+            flush()
+            level = len(heading.group(1))
+            out.append(f'<h{level}>{_inline(heading.group(2))}</h{level}>')
+        elif line.startswith(('- ', '* ')):
+            if paragraph:
+                flush()
+            items.append(_inline(line[2:]))
+        else:
+            if items:
+                flush()
+            paragraph.append(_inline(line))
+    flush()
+    return '\n'.join(out)
+
+
+def table_html(element):
+    """The table with the Styler's cell CSS, which uses the same
+    #T_<uuid>_row<r>_col<c> ids as pandas."""
+    df = element.value
+    styler = element.proto.arrow_data.styler
+    uuid = styler.uuid or 'snapshot'
+    show_index = not (df.index.dtype.kind == 'i' and (df.index == range(len(df))).all())
+    head = ''.join(f'<th>{html.escape(str(column))}</th>' for column in df.columns)
+    rows = []
+    for r, (index, values) in enumerate(zip(df.index, df.itertuples(index=False))):
+        cells = ''.join(
+            f'<td id="T_{uuid}_row{r}_col{c}">{"" if value != value else html.escape(str(value))}</td>'
+            for c, value in enumerate(values)
+        )
+        rows.append(f"<tr>{f'<th>{html.escape(str(index))}</th>' if show_index else ''}{cells}</tr>")
+    style = f'<style>{styler.styles}</style>' if styler.styles else ''
+    return (
+        f'{style}<table class="dataframe" id="T_{uuid}"><thead><tr>{"<th></th>" if show_index else ""}{head}</tr></thead>'
+        f'<tbody>{"".join(rows)}</tbody></table>'
+    )
+
+
+class PageWriter:
+    """Turns the AppTest element tree of one view into page HTML."""
+
+    def __init__(self, page_slug, out_dir, local_assets):
+        self.page_slug = page_slug
+        self.out_dir = out_dir
+        self.local_assets = local_assets
+        self.charts = 0
+        self.maps = 0
+
+    def node(self, node):
+        kind = type(node).__name__
+        children = getattr(node, 'children', None)
+        if kind == 'Column':
+            return f'<div class="column" style="flex: {node.proto.weight:.4g}">{self.children(node)}</div>'
+        if kind == 'Expander':
+            return f'<details><summary>{html.escape(node.label)}</summary>{self.children(node)}</details>'
+        if kind in ('Block', 'SpecialBlock') and children is not None:
+            horizontal = kind == 'Block' and node.proto.flex_container.direction == node.proto.flex_container.HORIZONTAL
+            return f'<div class="row">{self.children(node)}</div>' if horizontal else self.children(node)
+        if kind in ('Markdown', 'Caption'):
+            # The live app's stylesheet tag; pages link their own copy
+            if node.value.lstrip().startswith(('<style>', '<link rel="stylesheet"')):
+                return ''
+            body = markdown_html(node.value)
+            return f'<div class="caption">{body}</div>' if kind == 'Caption' else body
+        if kind in ('Title', 'Header', 'Subheader'):
+            return f'<{node.proto.tag}>{_inline(html.escape(node.proto.body))}</{node.proto.tag}>'
+        if kind == 'Dataframe':
+            return table_html(node)
+        if kind == 'UnknownElement' and node.type == 'plotly_chart':
+            return self.chart(node.proto)
+        if kind == 'UnknownElement' and node.type == 'iframe' and node.proto.srcdoc:
+            return self.map(node.proto.srcdoc)
+        # Widgets and anything else without a static form
+        return ''
+
+    def children(self, node):
+        return '\n'.join(self.node(node.children[key]) for key in sorted(node.children))
+
+    def chart(self, proto):
+        self.charts += 1
+        chart_id = f'chart-{self.charts}'
+        spec = json.loads(proto.spec)
+        config = {'responsive': True, 'displaylogo': False, **json.loads(proto.config or '{}')}
+        payload = json.dumps([spec.get('data', []), spec.get('layout', {}), config]).replace('</', '<\\/')
+        return f'<div class="chart" id="{chart_id}"></div><script>Plotly.newPlot("{chart_id}", ...{payload});</script>'
+
+    def map(self, srcdoc):
+        self.maps += 1
+        name = f'{self.page_slug}-{self.maps}.html'
+        # Leaflet files fetched with tile_server.py --fetch-assets are served
+        # from the snapshot instead of their CDNs
+        for asset, hashed in self.local_assets.items():
+            srcdoc = re.sub(r'https?://[^"\'\s]+/' + re.escape(asset), f'../assets/{hashed}', srcdoc)
+        (self.out_dir / 'maps' / name).write_text(srcdoc)
+        return f'<iframe class="map" src="maps/{name}" loading="lazy"></iframe>'
+
+
+def _open_view(section, label, option, timeout):
+    at = AppTest.from_file(str(SCRIPT), default_timeout=timeout).run()
+    next(widget for widget in at.sidebar.selectbox if widget.label == "Choose Section:").select(section)
+    at.run()
+    if label is not None:
+        next(widget for widget in at.main.selectbox if widget.label == label).select(option)
+        at.run()
+    if at.exception:
+        raise RuntimeError(f"{section} {option or ''} raised: {at.exception[0].message}")
+    return at
+
+
+def _nav(views, current, live_url):
+    links, open_section = [], None
+    for name, section, label, option, page in views:
+        css = ' class="current"' if page == current else ''
+        if option is None:
+            if open_section:
+                links.append('</ul></li>')
+                open_section = None
+            links.append(f'<li><a href="{page}"{css}>{html.escape(section)}</a></li>')
+            continue
+        if open_section != section:
+            if open_section:
+                links.append('</ul></li>')
+            links.append(f'<li><a href="{page}">{html.escape(section)}</a><ul>')
+            open_section = section
+        links.append(f'<li><a href="{page}"{css}>{html.escape(option)}</a></li>')
+    if open_section:
+        links.append('</ul></li>')
+    live = f'<p><a href="{html.escape(live_url)}">Open the interactive dashboard →</a></p>' if live_url else ''
+    return f'<nav><h2>Navigation</h2><ul>{"".join(links)}</ul>{live}</nav>'
+
+
+def build(out_dir=OUTPUT_DIR, live_url=None, timeout=120):
+    # The map is written as a standalone HTML page rather than through the
+    # st_folium component, which only works inside a live session; this has
+    # to be set before the map section first imports plantation_map
+    os.environ['DASHBOARD_MAP_MODE'] = 'html'
+    out_dir = Path(out_dir)
+    if (out_dir / MARKER).is_file():
+        shutil.rmtree(out_dir)
+    elif out_dir.exists() and any(out_dir.iterdir()):
+        raise FileExistsError(f'{out_dir} is not empty and was not written by snapshot.py; choose another --output')
+    assets_dir = out_dir / 'assets'
+    assets_dir.mkdir(parents=True)
+    (out_dir / 'maps').mkdir()
+    (out_dir / MARKER).write_text('Written by snapshot.py; the whole directory is replaced on the next export.\n')
+
+    stylesheets = [
+        _hashed_copy(page_style.CSS_FILE.read_bytes(), 'dashboard.css', assets_dir),
+        _hashed_copy(LAYOUT_CSS.lstrip().encode(), 'snapshot.css', assets_dir),
+    ]
+    plotly_js = _hashed_copy(plotly.offline.get_plotlyjs().encode(), 'plotly.min.js', assets_dir)
+    local_assets = {}
+    if Path(tile_server.ASSET_DIR).is_dir():
+        for path in sorted(Path(tile_server.ASSET_DIR).iterdir()):
+            if path.suffix in ('.js', '.css') and not path.name.startswith('dashboard.'):
+                local_assets[path.name] = _hashed_copy(path.read_bytes(), path.name, assets_dir)
+
+    views = [
+        (name, section, label, option, 'index.html' if i == 0 else f'{slug(name)}.html')
+        for i, (name, section, label, option) in enumerate(sections.views())
+    ]
+    created = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')
+    for name, section, label, option, page in views:
+        at = _open_view(section, label, option, timeout)
+        writer = PageWriter(Path(page).stem, out_dir, local_assets)
+        body = writer.node(at.main)
+        head = ''.join(f'<link rel="stylesheet" href="assets/{css}">' for css in stylesheets)
+        if writer.charts:
+            head += f'<script src="assets/{plotly_js}"></script>'
+        (out_dir / page).write_text(
+            f'<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8">'
+            f'<meta name="viewport" content="width=device-width, initial-scale=1">'
+            f'<title>{html.escape(name)} · {TITLE}</title>{head}</head>\n'
+            f'<body>{_nav(views, page, live_url)}\n<main>{body}\n'
+            f'<p class="caption">Snapshot taken {created}.</p></main></body></html>\n'
+        )
+        print(f'wrote {out_dir / page}')
+    return out_dir
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Render every dashboard view into static HTML pages.')
+    parser.add_argument('--output', default=OUTPUT_DIR, type=Path)
+    parser.add_argument('--live-url', help='link to the interactive dashboard shown in the navigation')
+    parser.add_argument('--timeout', default=120, type=float, help='seconds allowed per script run')
+    args = parser.parse_args()
+
+    try:
+        build(args.output, args.live_url, args.timeout)
+    except FileExistsError as e:
+        parser.error(str(e))
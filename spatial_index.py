@@ -0,0 +1,52 @@
+import numpy as np
+
+# Uniform lat/lon grid over point coordinates. Points are sorted by cell so
+# every grid row of a bounding-box query is one contiguous slice, found with
+# two binary searches.
+CELL_DEGREES = 0.25
+
+
+class GridIndex:
+    def __init__(self, lat, lon, cell=CELL_DEGREES):
+        self.lat = np.asarray(lat, dtype='float64')
+        self.lon = np.asarray(lon, dtype='float64')
+        self.cell = cell
+        self.lat0 = self.lat.min() if len(self.lat) else 0.0
+        self.lon0 = self.lon.min() if len(self.lon) else 0.0
+        self.n_cols = int((self.lon.max() - self.lon0) // cell) + 1 if len(self.lon) else 1
+
+        keys = self.cell_keys(self.lat, self.lon)
+        self.order = np.argsort(keys, kind='stable')
+        self.sorted_keys = keys[self.order]
+
+    def __len__(self):
+        return len(self.lat)
+
+    def cell_keys(self, lat, lon):
+        rows = ((lat - self.lat0) // self.cell).astype('int64')
+        cols = ((lon - self.lon0) // self.cell).astype('int64')
+        return rows * self.n_cols + cols
+
+    def query(self, south, west, north, east):
+        """Positions of the points inside the box, in index order."""
+        if not len(self.lat) or south > north or west > east:
+            return np.empty(0, dtype='int64')
+
+        row_lo = max(int((south - self.lat0) // self.cell), 0)
+        row_hi = int((north - self.lat0) // self.cell)
+        col_lo = max(int((west - self.lon0) // self.cell), 0)
+        col_hi = min(int((east - self.lon0) // self.cell), self.n_cols - 1)
+        if row_hi < row_lo or col_hi < col_lo:
+            return np.empty(0, dtype='int64')
+
+        rows = np.arange(row_lo, row_hi + 1)
+        starts = np.searchsorted(self.sorted_keys, rows * self.n_cols + col_lo, side='left')
+        ends = np.searchsorted(self.sorted_keys, rows * self.n_cols + col_hi, side='right')
+        candidates = np.concatenate([self.order[s:e] for s, e in zip(starts, ends)])
+
+        # Cells on the edge of the box are only partly inside it
+        inside = (
+            (self.lat[candidates] >= south) & (self.lat[candidates] <= north)
+            & (self.lon[candidates] >= west) & (self.lon[candidates] <= east)
+        )
+        return np.sort(candidates[inside])
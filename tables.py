@@ -0,0 +1,105 @@
+import math
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import timings
+
+# Tables longer than PAGE_SIZE rows are sorted, filtered and sliced on the
+# server, and only the visible page is styled and sent to the browser.
+PAGE_SIZE = int(os.environ.get('DASHBOARD_TABLE_PAGE_SIZE', 100))
+
+# Items listed in ranked panels such as the trade surplus/deficit lists;
+# the rest are summed into one "and N more" line
+TOP_N = int(os.environ.get('DASHBOARD_TOP_N', 10))
+
+SURPLUS_STYLE = 'background-color: #d4edda; color: #155724'
+DEFICIT_STYLE = 'background-color: #f8d7da; color: #721c24'
+
+
+def balance_colors(column):
+    """Cell styles for a whole numeric column: green above zero, red below."""
+    values = pd.to_numeric(column, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    return np.select([values > 0, values < 0], [SURPLUS_STYLE, DEFICIT_STYLE], default='')
+
+
+def style_balance(df, columns):
+    return df.style.apply(balance_colors, subset=columns)
+
+
+def top_n(df, column, n=TOP_N, largest=True):
+    """The n rows with the largest (or smallest) values of column, in order.
+
+    np.argpartition finds them without sorting the whole column; only the n
+    picked rows are sorted.
+    """
+    values = df[column].to_numpy(dtype='float64')
+    keys = -values if largest else values
+    picked = np.argpartition(keys, n - 1)[:n] if 0 < n < len(values) else np.arange(min(max(n, 0), len(values)))
+    return df.iloc[picked[np.argsort(keys[picked], kind='stable')]]
+
+
+def search_rows(df, column, text):
+    if not text:
+        return df
+    return df[df[column].astype(str).str.contains(text, case=False, regex=False, na=False)]
+
+
+def page(df, page_number=1, page_size=PAGE_SIZE, sort_by=None, ascending=True):
+    """Rows of one page of df, optionally sorted by a column."""
+    start = (page_number - 1) * page_size
+    end = min(start + page_size, len(df))
+    if sort_by is None:
+        return df.iloc[start:end]
+    # Only the rows up to the end of the page have to be put in order
+    top = df.nsmallest(end, sort_by) if ascending else df.nlargest(end, sort_by)
+    return top.iloc[start:end]
+
+
+def _first_page(key):
+    # A new search or sort starts again from the first page, which also keeps
+    # the page number inside the new page count
+    st.session_state[f'{key}_page'] = 1
+
+
+def paged_table(df, key, style=None, page_size=PAGE_SIZE):
+    """st.dataframe that pages through long tables on the server.
+
+    style(df) returns a Styler for the rows being shown. Tables that fit on
+    one page are shown whole, as before.
+    """
+    if len(df) <= page_size:
+        with timings.span('dataframe', key):
+            st.dataframe(style(df) if style else df, width='stretch')
+        return
+    _pager(df, key, style, page_size)
+
+
+# Searching, sorting and paging only rerun the table itself
+@st.fragment
+def _pager(df, key, style, page_size):
+    with timings.timed(key):
+        text_columns = [column for column in df.columns if not pd.api.types.is_numeric_dtype(df[column])]
+        numeric_columns = [column for column in df.columns if pd.api.types.is_numeric_dtype(df[column])]
+
+        col1, col2, col3 = st.columns([2, 2, 1])
+        with col1:
+            search = st.text_input(f"Search {text_columns[0]}", key=f'{key}_search', on_change=_first_page, args=(key,)) if text_columns else ''
+        with col2:
+            sort_by = st.selectbox("Sort by", ['(none)'] + numeric_columns, key=f'{key}_sort', on_change=_first_page, args=(key,))
+        with col3:
+            ascending = st.radio("Order", ["Descending", "Ascending"], key=f'{key}_order', on_change=_first_page, args=(key,)) == "Ascending"
+
+        matching = search_rows(df, text_columns[0], search) if text_columns else df
+        pages = max(math.ceil(len(matching) / page_size), 1)
+        # Seeded through session state only, since _first_page also sets it
+        st.session_state.setdefault(f'{key}_page', 1)
+        page_number = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, key=f'{key}_page')
+
+        rows = page(matching, page_number, page_size, None if sort_by == '(none)' else sort_by, ascending)
+        with timings.span('dataframe', key):
+            st.dataframe(style(rows) if style else rows, width='stretch')
+        first = (page_number - 1) * page_size
+        st.caption(f"Rows {first + min(len(rows), 1):,}-{first + len(rows):,} of {len(matching):,}")
@@ -0,0 +1,255 @@
+import argparse
+import hashlib
+import mimetypes
+import os
+import re
+import sqlite3
+import threading
+import urllib.request
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# In-process basemap tile server for deployments without internet access.
+# Tiles come from an MBTiles file or an XYZ directory ({z}/{x}/{y}.<ext>)
+# named by DASHBOARD_TILES. Recently served tiles are kept in an in-memory
+# LRU bounded by DASHBOARD_TILE_CACHE_MB. The server also serves the Leaflet
+# JS/CSS that folium would otherwise load from CDNs, from DASHBOARD_ASSET_DIR.
+# The browser must be able to reach the server at DASHBOARD_TILE_URL.
+TILES = os.environ.get('DASHBOARD_TILES')
+HOST = os.environ.get('DASHBOARD_TILE_HOST', '0.0.0.0')
+PORT = int(os.environ.get('DASHBOARD_TILE_PORT', 8765))
+PUBLIC_URL = os.environ.get('DASHBOARD_TILE_URL', f'http://localhost:{PORT}').rstrip('/')
+CACHE_BYTES = int(float(os.environ.get('DASHBOARD_TILE_CACHE_MB', 64)) * 1024 * 1024)
+ASSET_DIR = Path(os.environ.get('DASHBOARD_ASSET_DIR', Path(__file__).parent / 'data' / 'assets'))
+ATTRIBUTION = os.environ.get('DASHBOARD_TILE_ATTRIBUTION', '&copy; OpenStreetMap contributors')
+
+# Tiles and assets never change under a given URL for the life of a
+# deployment, so browsers may keep them for a week without revalidating
+CACHE_CONTROL = 'public, max-age=604800, immutable'
+
+TILE_PATH = re.compile(r'^/tiles/(\d+)/(\d+)/(\d+)\.(\w+)$')
+ASSET_PATH = re.compile(r'^/assets/([\w.@-]+)$')
+
+
+class MBTilesSource:
+    def __init__(self, path):
+        self.path = str(path)
+        self._local = threading.local()
+        metadata = dict(self._connection().execute('SELECT name, value FROM metadata').fetchall())
+        self.content_type = mimetypes.types_map.get('.' + metadata.get('format', 'png'), 'image/png')
+
+    def _connection(self):
+        # sqlite connections cannot be shared between the server threads
+        if not hasattr(self._local, 'connection'):
+            self._local.connection = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True, check_same_thread=False)
+        return self._local.connection
+
+    def get(self, z, x, y, ext=None):
+        # MBTiles rows are numbered TMS-style, from the bottom
+        row = self._connection().execute(
+            'SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?',
+            (z, x, (1 << z) - 1 - y)
+        ).fetchone()
+        return (row[0], self.content_type) if row else None
+
+
+class DirectorySource:
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def get(self, z, x, y, ext='png'):
+        tile = self.path / str(z) / str(x) / f'{y}.{ext}'
+        if not tile.is_file():
+            return None
+        return tile.read_bytes(), mimetypes.types_map.get(f'.{ext}', 'application/octet-stream')
+
+
+def open_source(path):
+    path = Path(path)
+    if path.suffix == '.mbtiles':
+        return MBTilesSource(path)
+    if path.is_dir():
+        return DirectorySource(path)
+    raise ValueError(f'{path} is neither an .mbtiles file nor a tile directory')
+
+
+class HotTileCache:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._tiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._tiles:
+                return None
+            self._tiles.move_to_end(key)
+            return self._tiles[key]
+
+    def put(self, key, entry):
+        with self._lock:
+            if key in self._tiles:
+                return
+            self._tiles[key] = entry
+            self.size += len(entry[0])
+            while self.size > self.max_bytes and self._tiles:
+                _, (data, _, _) = self._tiles.popitem(last=False)
+                self.size -= len(data)
+
+
+def _entry(data, content_type):
+    return data, content_type, '"' + hashlib.blake2b(data, digest_size=12).hexdigest() + '"'
+
+
+class TileHandler(BaseHTTPRequestHandler):
+    source = None
+    cache = None
+    asset_dir = ASSET_DIR
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        tile = TILE_PATH.match(path)
+        asset = ASSET_PATH.match(path)
+        if tile:
+            entry = self._tile(*tile.groups())
+        elif asset:
+            entry = self._asset(asset.group(1))
+        else:
+            entry = None
+
+        if entry is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            return
+
+        data, content_type, etag = entry
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', CACHE_CONTROL)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('Cache-Control', CACHE_CONTROL)
+        self.send_header('ETag', etag)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _tile(self, z, x, y, ext):
+        if self.source is None:
+            return None
+        key = ('tile', int(z), int(x), int(y), ext)
+        entry = self.cache.get(key)
+        if entry is None:
+            found = self.source.get(int(z), int(x), int(y), ext)
+            if found is None:
+                return None
+            entry = _entry(*found)
+            self.cache.put(key, entry)
+        return entry
+
+    def _asset(self, name):
+        key = ('asset', name)
+        entry = self.cache.get(key)
+        if entry is None:
+            path = Path(self.asset_dir) / name
+            if not path.is_file():
+                return None
+            entry = _entry(path.read_bytes(), mimetypes.guess_type(name)[0] or 'application/octet-stream')
+            self.cache.put(key, entry)
+        return entry
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(tiles=TILES, host=HOST, port=PORT, cache_bytes=CACHE_BYTES, asset_dir=ASSET_DIR):
+    """The server, bound but not yet serving."""
+    handler = type('Handler', (TileHandler,), {
+        'source': open_source(tiles) if tiles else None,
+        'cache': HotTileCache(cache_bytes),
+        'asset_dir': asset_dir,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start(tiles=TILES, host=HOST, port=PORT, cache_bytes=CACHE_BYTES, asset_dir=ASSET_DIR):
+    """Start the server on a daemon thread and return it."""
+    server = make_server(tiles, host, port, cache_bytes, asset_dir)
+    threading.Thread(target=server.serve_forever, name='tile-server', daemon=True).start()
+    return server
+
+
+def enabled():
+    return bool(TILES)
+
+
+def tiles_url(ext='png'):
+    return f'{PUBLIC_URL}/tiles/{{z}}/{{x}}/{{y}}.{ext}'
+
+
+def _asset_name(url):
+    return url.rsplit('/', 1)[-1]
+
+
+def localize_assets(element, asset_dir=ASSET_DIR):
+    """Point the JS/CSS links of a folium element tree at the local server.
+
+    Only links whose file exists in the asset directory are rewritten, so a
+    partially populated directory still works with the CDN for the rest.
+    """
+    if not enabled():
+        return element
+    for attr in ('default_js', 'default_css'):
+        links = getattr(element, attr, None)
+        if links:
+            setattr(element, attr, [
+                (name, f'{PUBLIC_URL}/assets/{_asset_name(url)}' if (Path(asset_dir) / _asset_name(url)).is_file() else url)
+                for name, url in links
+            ])
+    for child in getattr(element, '_children', {}).values():
+        localize_assets(child, asset_dir)
+    return element
+
+
+def fetch_assets(asset_dir=ASSET_DIR):
+    # Run once on a machine with internet access, then copy the directory
+    import folium
+    from branca.colormap import LinearColormap
+    from folium.plugins import FastMarkerCluster
+
+    asset_dir = Path(asset_dir)
+    asset_dir.mkdir(parents=True, exist_ok=True)
+    links = []
+    for element in (folium.Map, FastMarkerCluster, LinearColormap, folium.GeoJson):
+        links += getattr(element, 'default_js', []) + getattr(element, 'default_css', [])
+    for _, url in dict.fromkeys(links):
+        path = asset_dir / _asset_name(url)
+        with urllib.request.urlopen(url) as response:
+            path.write_bytes(response.read())
+        print(f'{url} -> {path}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve basemap tiles and map assets locally.')
+    parser.add_argument('--fetch-assets', action='store_true', help='download the Leaflet JS/CSS into the asset directory and exit')
+    parser.add_argument('--tiles', default=TILES, help='.mbtiles file or XYZ tile directory')
+    parser.add_argument('--port', default=PORT, type=int)
+    args = parser.parse_args()
+
+    if args.fetch_assets:
+        fetch_assets()
+    else:
+        print(f'serving {args.tiles} on port {args.port}')
+        # Served on the main thread only; start() is for running inside the app
+        make_server(args.tiles, port=args.port).serve_forever()
@@ -0,0 +1,139 @@
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import streamlit as st
+
+# Rerun timings per widget. In-section widgets live in st.fragment panels, so
+# changing one only reruns its panel; the time of each panel run is kept in
+# st.session_state['rerun_timings'] under the name of the widget driving it,
+# next to the time of the last full script run.
+SHOW = os.environ.get('DASHBOARD_SHOW_TIMINGS', '').lower() in ('1', 'true', 'yes')
+
+FULL_RUN = 'full run'
+
+# Debug mode, turned on for every session with DASHBOARD_DEBUG=1 or for one
+# session by opening the app with ?debug=1, also times each stage of a rerun
+# (CSS, dataset loads, figure builds, chart and map sends, table styling).
+# Recent spans are listed in a sidebar panel and every span
+# is appended as one JSON line to DEBUG_LOG.
+DEBUG = os.environ.get('DASHBOARD_DEBUG', '').lower() in ('1', 'true', 'yes')
+DEBUG_LOG = Path(os.environ.get('DASHBOARD_DEBUG_LOG', Path(__file__).parent / 'data' / 'logs' / 'debug_timings.jsonl'))
+
+_log_lock = threading.Lock()
+
+
+def record(widget, seconds):
+    st.session_state.setdefault('rerun_timings', {})[widget] = seconds
+
+
+def last(widget):
+    return st.session_state.get('rerun_timings', {}).get(widget)
+
+
+def start_run():
+    """Called at the top of every full script run."""
+    debug = DEBUG or st.query_params.get('debug', '').lower() in ('1', 'true', 'yes')
+    st.session_state['debug'] = debug
+    if debug:
+        st.session_state.setdefault('debug_session', uuid.uuid4().hex[:8])
+        st.session_state['debug_run'] = st.session_state.get('debug_run', 0) + 1
+
+
+def debugging():
+    return st.session_state.get('debug', False)
+
+
+def _write_log(entry):
+    with _log_lock:
+        DEBUG_LOG.parent.mkdir(parents=True, exist_ok=True)
+        with open(DEBUG_LOG, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+
+
+@contextmanager
+def span(stage, detail=None):
+    """Times one stage of the rerun when debug mode is on."""
+    if not debugging():
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry = {
+            'run': st.session_state.get('debug_run'),
+            'stage': stage,
+            'detail': detail,
+            'panel': st.session_state.get('debug_panel'),
+            'ms': round((time.perf_counter() - start) * 1000, 2),
+        }
+        st.session_state.setdefault('debug_spans', []).append(entry)
+        _write_log({
+            'time': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+            'session': st.session_state.get('debug_session'),
+            **entry,
+        })
+
+
+@contextmanager
+def timed(widget):
+    start = time.perf_counter()
+    outer = st.session_state.get('debug_panel')
+    st.session_state['debug_panel'] = widget
+    try:
+        with span('panel', widget):
+            yield
+    finally:
+        st.session_state['debug_panel'] = outer
+    elapsed = time.perf_counter() - start
+    record(widget, elapsed)
+    if SHOW or debugging():
+        st.caption(f"⏱️ {widget}: {elapsed * 1000:.0f} ms")
+
+
+def fragment(widget):
+    """st.fragment that times each run of the panel under widget's name."""
+    def decorator(func):
+        @st.fragment
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            with timed(widget):
+                func(*args, **kwargs)
+        return run
+    return decorator
+
+
+def plotly_chart(fig, **kwargs):
+    # st.plotly_chart, timed under the figure's title in debug mode
+    title = fig.layout.title.text if fig.layout.title and fig.layout.title.text else None
+    with span('plotly_chart', title):
+        return st.plotly_chart(fig, **kwargs)
+
+
+def debug_panel():
+    """Sidebar list of the spans recorded since the panel was last drawn.
+
+    Fragments cannot draw into the sidebar, so spans from panel reruns show
+    up here on the next full run; they are in the log straight away.
+    """
+    if not debugging():
+        return
+    spans = st.session_state.get('debug_spans', [])
+    st.session_state['debug_spans'] = []
+    with st.sidebar.expander("⏱️ Debug timings", expanded=True):
+        st.caption(
+            f"Run {st.session_state.get('debug_run')} · {FULL_RUN} "
+            f"{(last(FULL_RUN) or 0) * 1000:.0f} ms · logged to {DEBUG_LOG.name}"
+        )
+        if spans:
+            st.dataframe(
+                [{'Run': s['run'], 'Stage': s['stage'], 'Detail': s['detail'] or '', 'Panel': s['panel'] or '', 'ms': s['ms']} for s in spans],
+                hide_index=True, width='stretch'
+            )
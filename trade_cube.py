@@ -0,0 +1,119 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import data_store
+
+# Dense year x commodity x partner x flow cube of trade values in USD, with
+# the dimensions stored as integer positions into sorted label arrays. It is
+# built once by ingest.py and saved next to the store tables, and Trade
+# Analysis answers every slice from it with array indexing and the
+# precomputed marginals instead of pandas group-bys.
+#
+# The cube takes years x commodities x partners x 2 x 8 bytes, so HS-level
+# data should be ingested at HS4 or coarser when partners are included.
+CUBE_FILE = 'trade_cube.npz'
+FLOWS = ['Export', 'Import']
+
+# Year shown for the bundled crop-level trade figures
+BUNDLED_YEAR = 2024
+WORLD = 'World'
+
+
+class TradeCube:
+    def __init__(self, years, commodities, partners, values):
+        self.years = np.asarray(years, dtype='int64')
+        self.commodities = np.asarray(commodities, dtype=object)
+        self.partners = np.asarray(partners, dtype=object)
+        self.values = np.asarray(values, dtype='float64')
+
+        # Marginal over all partners, the default slice
+        self.by_commodity = self.values.sum(axis=2)
+        for array in (self.values, self.by_commodity):
+            array.setflags(write=False)
+
+        self._year_pos = {int(year): i for i, year in enumerate(self.years)}
+        self._partner_pos = {partner: i for i, partner in enumerate(self.partners)}
+
+    @classmethod
+    def from_frame(cls, trade):
+        """Cube from long rows of Year, Crop, Partner, Flow and Value_USD."""
+        years, year_codes = np.unique(trade['Year'].to_numpy(dtype='int64'), return_inverse=True)
+        commodities, commodity_codes = np.unique(trade['Crop'].astype(str).to_numpy(), return_inverse=True)
+        partners, partner_codes = np.unique(trade['Partner'].astype(str).to_numpy(), return_inverse=True)
+        flow_codes = pd.Categorical(trade['Flow'], categories=FLOWS).codes
+        known = flow_codes >= 0
+
+        values = np.zeros((len(years), len(commodities), len(partners), len(FLOWS)))
+        np.add.at(
+            values,
+            (year_codes[known], commodity_codes[known], partner_codes[known], flow_codes[known]),
+            trade['Value_USD'].to_numpy(dtype='float64')[known]
+        )
+        return cls(years, commodities, partners, values)
+
+    @classmethod
+    def from_crop_data(cls, crop_data):
+        # The bundled crop table has one year of world totals in billions
+        values = np.stack([
+            crop_data['Export_Value_Billion_USD'].to_numpy(dtype='float64'),
+            crop_data['Import_Value_Billion_USD'].to_numpy(dtype='float64'),
+        ], axis=-1) * 1e9
+        return cls([BUNDLED_YEAR], crop_data['Crop'].astype(str), [WORLD], values[np.newaxis, :, np.newaxis, :])
+
+    def save(self, data_dir=None):
+        path = cube_path(data_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp.npz')
+        np.savez(
+            tmp_path, years=self.years, values=self.values,
+            commodities=self.commodities.astype(str), partners=self.partners.astype(str)
+        )
+        stamp = data_store.file_fingerprint(tmp_path)
+        os.replace(tmp_path, path)
+        data_store.write_digest(path, stamp)
+        return path
+
+    @classmethod
+    def load(cls, data_dir=None):
+        with np.load(cube_path(data_dir)) as arrays:
+            return cls(arrays['years'], arrays['commodities'], arrays['partners'], arrays['values'])
+
+    def flows(self, year=None, partners=None):
+        """(commodity, flow) values for one year, over all or some partners."""
+        year = self._year_pos[int(year)] if year is not None else len(self.years) - 1
+        if not partners:
+            return self.by_commodity[year]
+        positions = [self._partner_pos[partner] for partner in partners]
+        return self.values[year][:, positions, :].sum(axis=1)
+
+    def commodity_table(self, year=None, partners=None):
+        """Exports, imports and net trade per commodity, in billion USD."""
+        flows = self.flows(year, partners) / 1e9
+        return pd.DataFrame({
+            'Crop': self.commodities,
+            'Export_Value_Billion_USD': flows[:, 0],
+            'Import_Value_Billion_USD': flows[:, 1],
+            # Rounded so differences of round figures stay round
+            'Net_Trade_Billion_USD': (flows[:, 0] - flows[:, 1]).round(6),
+        })
+
+
+def cube_path(data_dir=None):
+    return Path(data_dir or data_store.DATA_DIR) / CUBE_FILE
+
+
+def fingerprint(data_dir=None):
+    path = cube_path(data_dir)
+    if not path.exists():
+        return 'bundled'
+    return data_store.file_version(path)
+
+
+def load(data_dir=None):
+    # Without an ingested cube the bundled crop table stands in
+    if cube_path(data_dir).exists():
+        return TradeCube.load(data_dir)
+    return TradeCube.from_crop_data(data_store.read_table('crop_data', data_dir))